@@ -1,28 +1,252 @@
 """Base geometry classes and data structures."""
 
-from dataclasses import dataclass
-from typing import Any, Dict, Optional, Type, Tuple
-import pyvista as pv
-from .types import GeometryType
+from __future__ import annotations
 
-class GeometryError(Exception):
-    """Custom exception for geometry-related errors."""
-    pass
+import math
+import os
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Optional, Type, Tuple
+import numpy as np
+from .types import GeometryError, GeometryType, GeometryValidationError
 
-class GeometryValidationError(GeometryError):
-    """Exception raised when geometry validation fails."""
-    pass
+if TYPE_CHECKING:  # PyVista loads VTK, so it is imported where meshes are built
+    import pyvista as pv
 
-@dataclass
+try:
+    import manifold3d
+except ImportError:  # Optional dependency for fast boolean operations
+    manifold3d = None
+
+# Whether from_pyvista validates meshes; set CAD_VALIDATE=0 to skip it
+_VALIDATE_MESHES = os.getenv("CAD_VALIDATE", "1") != "0"
+
+def _rotation_matrix(angle: float, axis: Tuple[float, float, float]) -> np.ndarray:
+    """Build a 3x3 rotation matrix using Rodrigues' formula.
+    
+    Args:
+        angle: Rotation angle in degrees.
+        axis: Rotation axis as a tuple (x, y, z).
+    
+    Returns:
+        Read-only rotation matrix for a right-handed rotation around the axis.
+    
+    Raises:
+        ValueError: If the axis has zero length.
+    """
+    x, y, z = (float(c) for c in axis)
+    return _cached_rotation_matrix(float(angle), x, y, z)
+
+@lru_cache(maxsize=256)
+def _cached_rotation_matrix(angle: float, x: float, y: float, z: float) -> np.ndarray:
+    """Rodrigues' formula in scalar arithmetic, cached per angle and axis.
+    
+    Parts are usually rotated by a few recurring angles about the
+    coordinate axes, so most calls are cache hits; misses build the matrix
+    from Python floats, avoiding a handful of tiny NumPy temporaries.
+    """
+    norm = math.sqrt(x * x + y * y + z * z)
+    if norm == 0.0:
+        raise ValueError("Rotation axis must have non-zero length")
+    x, y, z = x / norm, y / norm, z / norm
+    theta = math.radians(angle)
+    s, c = math.sin(theta), math.cos(theta)
+    t = 1.0 - c
+    matrix = np.array([[t * x * x + c, t * x * y - s * z, t * x * z + s * y],
+                       [t * x * y + s * z, t * y * y + c, t * y * z - s * x],
+                       [t * x * z - s * y, t * y * z + s * x, t * z * z + c]])
+    matrix.flags.writeable = False
+    return matrix
+
+# Transforms equal to this within tolerance are stored as None
+_IDENTITY = np.eye(4)
+_IDENTITY.flags.writeable = False
+
+def _is_rigid(matrix: np.ndarray) -> bool:
+    """Check whether a 4x4 matrix is a rotation plus a translation."""
+    rotation = matrix[:3, :3]
+    return (np.array_equal(matrix[3], [0.0, 0.0, 0.0, 1.0])
+            and np.allclose(rotation @ rotation.T, np.eye(3), atol=1e-6)
+            and np.linalg.det(rotation) > 0)
+
+class Entity:
+    """A positioned geometric entity such as a sketch point."""
+    
+    def __init__(self, position: np.ndarray, direction: Optional[np.ndarray] = None) -> None:
+        """Initialize an entity.
+        
+        Args:
+            position: Position of the entity as an (x, y, z) array.
+            direction: Optional unit direction associated with the entity.
+        """
+        self.position: np.ndarray = np.asarray(position)
+        self.direction: Optional[np.ndarray] = direction
+
+def _to_float32_points(mesh: pv.PolyData, inplace: bool = False) -> pv.PolyData:
+    """Get a mesh whose points are a contiguous float32 array.
+    
+    Geometry keeps points in single precision so every pass over them
+    (transforms, bounds, export) moves half the bytes of float64. Cell
+    arrays are left alone since VTK stores them as vtkIdType anyway.
+    
+    Args:
+        mesh: PyVista mesh.
+        inplace: Convert the points of the mesh itself instead of a shallow
+            copy. Only for meshes the library created and owns.
+    
+    Returns:
+        The mesh if its points are already float32 or inplace is set,
+        otherwise a shallow copy sharing its cells.
+    """
+    points = mesh.points
+    if points.dtype == np.float32 and points.flags.c_contiguous:
+        return mesh
+    points = np.ascontiguousarray(points, dtype=np.float32)
+    if inplace:
+        mesh.points = points
+        return mesh
+    return _mesh_with_points(mesh, points)
+
+def _is_all_tris(mesh: pv.PolyData) -> bool:
+    """Check whether a mesh consists of triangles only.
+    
+    Every polygon has at least three point ids, so the polygons are all
+    triangles exactly when they hold three ids each. This needs only the
+    cell counts, not a pass over the face array.
+    
+    Args:
+        mesh: PyVista mesh to check.
+    
+    Returns:
+        True if the mesh is non-empty and every cell is a triangle.
+    """
+    polys = mesh.GetPolys()
+    n_polys = polys.GetNumberOfCells()
+    return (n_polys > 0 and n_polys == mesh.GetNumberOfCells() and
+            polys.GetNumberOfConnectivityIds() == 3 * n_polys)
+
+def _mesh_key(mesh: pv.PolyData) -> Tuple[int, int]:
+    """Identify a mesh and the state of its points for cache lookups."""
+    return (id(mesh), mesh.GetPoints().GetMTime())
+
+def _tris_to_vtk_faces(triangles: np.ndarray) -> np.ndarray:
+    """Convert triangle vertex indices to a VTK face array.
+    
+    The array is allocated once with VTK's id type, so PolyData can use it
+    without another conversion pass.
+    
+    Args:
+        triangles: (F, 3) array of vertex indices.
+    
+    Returns:
+        Flat int64 array of the form [3, i, j, k, 3, i, j, k, ...].
+    """
+    faces = np.empty((len(triangles), 4), dtype=np.int64)
+    faces[:, 0] = 3
+    faces[:, 1:] = triangles
+    return faces.ravel()
+
+def _ensure_tri(geometry: Geometry) -> pv.PolyData:
+    """Get the mesh of a geometry as triangles.
+    
+    Meshes already known to be triangulated are returned as they are.
+    Otherwise the mesh is checked, triangulated if needed, and the result
+    is stored back on the geometry so later calls skip the work.
+    
+    Args:
+        geometry: Geometry whose mesh is needed.
+    
+    Returns:
+        The triangulated PyVista mesh.
+    """
+    mesh = geometry.to_pyvista()
+    data = geometry.data
+    if not data.is_triangulated:
+        if not _is_all_tris(mesh):
+            mesh = _to_float32_points(mesh.triangulate(), inplace=True)
+            data.mesh = mesh
+        data.is_triangulated = True
+    return mesh
+
+def _mesh_with_points(mesh: pv.PolyData, points: np.ndarray) -> pv.PolyData:
+    """Create a mesh with the cells of another mesh and new points.
+    
+    Args:
+        mesh: Mesh whose cells are shared with the result.
+        points: (N, 3) array of point coordinates for the result.
+    
+    Returns:
+        A shallow copy of the mesh using the given points.
+    """
+    import pyvista as pv
+    
+    result = mesh.copy(deep=False)
+    result.SetPoints(pv.vtk_points(points, deep=False))
+    return result
+
+def _apply_transform(mesh: pv.PolyData, matrix: np.ndarray) -> pv.PolyData:
+    """Apply a 4x4 rigid transform to the points of a mesh.
+    
+    Args:
+        mesh: Mesh to transform, left unchanged.
+        matrix: Homogeneous transform with rotation and translation only.
+    
+    Returns:
+        A new mesh sharing cells with the input.
+    """
+    source = np.asarray(mesh.points)
+    rotation = matrix[:3, :3].astype(source.dtype)
+    translation = matrix[:3, 3].astype(source.dtype)
+    
+    # The result escapes into the new mesh, so it is the one allocation
+    # per transform; the translation is added to it in place
+    points = np.empty_like(source)
+    if np.array_equal(rotation, np.eye(3)):
+        np.add(source, translation, out=points)
+    else:
+        np.matmul(source, rotation.T, out=points)
+        points += translation
+    return _mesh_with_points(mesh, points)
+
+# dataclass(slots=True) needs Python 3.10
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class GeometryData:
     """Container for geometry-specific data."""
     type: GeometryType
     parameters: Dict[str, Any]
     mesh: Optional[pv.PolyData] = None
+    # Whether the mesh is known to contain triangles only
+    is_triangulated: bool = False
+    # 4x4 transform not yet applied to the mesh points, None for identity
+    pending_transform: Optional[np.ndarray] = None
+    # Whether the shape is a primitive fully described by its parameters in
+    # its local frame, and the 4x4 transform from that frame (including any
+    # pending part), None for identity
+    analytic: bool = False
+    placement: Optional[np.ndarray] = None
+    # Points and (F, 3) triangles of the mesh as plain arrays, valid while
+    # _arrays_key matches the (mesh id, points modification time) of the mesh
+    points: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
+    tris: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
+    _arrays_key: Optional[Tuple[int, int]] = field(default=None, repr=False, compare=False)
+    # Cached (min, max) corners of the points, with the same kind of key
+    _bounds_cache: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
+    _bounds_key: Optional[Tuple[int, int]] = field(default=None, repr=False, compare=False)
+    # Cached enclosed volume of the mesh, with the same kind of key
+    _volume_cache: Optional[float] = field(default=None, repr=False, compare=False)
+    _volume_key: Optional[Tuple[int, int]] = field(default=None, repr=False, compare=False)
+    # Cached manifold3d solid of the mesh, with the same kind of key
+    _manifold: Any = field(default=None, repr=False, compare=False)
+    _manifold_key: Optional[Tuple[int, int]] = field(default=None, repr=False, compare=False)
 
 class Geometry:
     """Abstract Geometry base class defining core API for all geometric primitives."""
     
+    __slots__ = ("_data",)
+    
     def __init__(self) -> None:
         self._data: GeometryData = None
         
@@ -42,30 +266,40 @@ class Geometry:
         Raises:
             GeometryError: If conversion fails.
         """
-        if self.data.mesh is None:
+        data = self.data
+        if data.mesh is None:
             self._create_mesh()
-        return self.data.mesh
+        if data.pending_transform is not None:
+            data.mesh = _apply_transform(data.mesh, data.pending_transform)
+            data.pending_transform = None
+        return data.mesh
     
     @classmethod
-    def from_pyvista(cls: Type["Geometry"], mesh: pv.PolyData) -> "Geometry":
+    def from_pyvista(cls: Type["Geometry"], mesh: pv.PolyData, *, validate: bool = True) -> "Geometry":
         """Create geometry from PyVista mesh.
         
         Args:
             mesh: PyVista mesh to convert.
+            validate: Whether to validate the mesh. Internal callers that
+                derive the mesh from an already valid one may skip this.
             
         Returns:
-            New Geometry instance.
+            New Geometry instance. It stores points as float32; a mesh with
+            other points is converted on a shallow copy, so the input keeps
+            its precision.
             
         Raises:
             GeometryValidationError: If mesh is invalid.
         """
-        if not cls._validate_mesh(mesh):
-            raise GeometryValidationError("Invalid mesh provided")
+        # Validation is skipped entirely with python -O or CAD_VALIDATE=0
+        if __debug__ and _VALIDATE_MESHES and validate and not cls._validate_mesh(mesh):
+            reason = cls._validate_mesh_verbose(mesh)
+            raise GeometryValidationError(f"Invalid mesh provided: {reason}")
         instance = cls()
         instance._data = GeometryData(
             type=GeometryType.MESH,
             parameters={},
-            mesh=mesh
+            mesh=_to_float32_points(mesh)
         )
         return instance
     
@@ -79,12 +313,33 @@ class Geometry:
         Returns:
             True if valid, False if not.
         """
-        try:
-            return (mesh.n_points > 0 and
-                   mesh.n_cells > 0 and
-                   isinstance(mesh, pv.PolyData))
-        except Exception as e:
-            return False
+        import pyvista as pv
+        
+        # Direct VTK getters avoid the PyVista property wrappers; the type
+        # check comes first so they are only called on PolyData
+        return (isinstance(mesh, pv.PolyData) and
+                mesh.GetNumberOfPoints() > 0 and
+                mesh.GetNumberOfCells() > 0)
+    
+    @staticmethod
+    def _validate_mesh_verbose(mesh: pv.PolyData) -> Optional[str]:
+        """Explain why a PyVista mesh is invalid.
+        
+        Args:
+            mesh: PyVista mesh to validate.
+            
+        Returns:
+            None if valid, otherwise a description of the problem.
+        """
+        import pyvista as pv
+        
+        if not isinstance(mesh, pv.PolyData):
+            return f"expected PolyData, got {type(mesh).__name__}"
+        if mesh.GetNumberOfPoints() == 0:
+            return "mesh has no points"
+        if mesh.GetNumberOfCells() == 0:
+            return "mesh has no cells"
+        return None
     
     def _create_mesh(self) -> None:
         """Create PyVista mesh from internal parameters.
@@ -94,19 +349,139 @@ class Geometry:
         """
         raise NotImplementedError("_create_mesh() must be implemented by subclasses.")
     
+    def to_manifold(self) -> "manifold3d.Mesh":
+        """Convert geometry to a manifold3d mesh.
+        
+        Returns:
+            manifold3d Mesh with float32 vertices and uint32 triangle indices.
+            
+        Raises:
+            GeometryError: If manifold3d is not installed.
+        """
+        if manifold3d is None:
+            raise GeometryError("manifold3d is required for to_manifold()")
+        points, triangles = self._arrays()
+        return manifold3d.Mesh(
+            vert_properties=points,
+            tri_verts=triangles.astype(np.uint32)
+        )
+    
     def bounding_box(self) -> Tuple[float, float, float]:
-        """Compute the bounding box of the geometry using PyVista.
+        """Compute the bounding box of the geometry.
+        
+        The point extents are cached and reused until the mesh or its
+        points change.
         
         Returns:
             Tuple containing (width, height, depth).
         """
-        mesh = self.to_pyvista()
-        bounds = mesh.bounds
-        return (
-            bounds[1] - bounds[0],  # width
-            bounds[3] - bounds[2],  # height
-            bounds[5] - bounds[4]   # depth
-        )
+        lower, upper = self._bounds()
+        width, height, depth = (upper - lower).tolist()
+        return (width, height, depth)
+    
+    @property
+    def volume(self) -> float:
+        """Volume enclosed by the geometry.
+        
+        Primitives compute it from their parameters, which rigid transforms
+        leave unchanged. Other meshes sum signed tetrahedra over their
+        triangles once and cache the result until the mesh changes.
+        
+        Returns:
+            The enclosed volume.
+        """
+        data = self.data
+        if data.analytic:
+            volume = self._analytic_volume()
+            if volume is not None:
+                return volume
+        points, triangles = self._arrays()
+        if data._volume_key != data._arrays_key:
+            corners = points.astype(np.float64)[triangles]
+            signed = np.einsum('ij,ij->i', corners[:, 0], np.cross(corners[:, 1], corners[:, 2]))
+            data._volume_cache = abs(float(signed.sum())) / 6.0
+            data._volume_key = data._arrays_key
+        return data._volume_cache
+    
+    def _analytic_volume(self) -> Optional[float]:
+        """Volume from the primitive's parameters, or None if unknown.
+        
+        Subclasses with analytic parameters override this.
+        """
+        return None
+    
+    @property
+    def bounds(self) -> Tuple[float, float, float, float, float, float]:
+        """Axis-aligned box enclosing the geometry.
+        
+        For primitives this is computed from their parameters and placement
+        without building the mesh. It may then be slightly larger than the
+        mesh (a rotated cylinder is bounded as its circumscribed box), which
+        makes it suitable for overlap tests but not for measurements.
+        
+        Returns:
+            Tuple (xmin, xmax, ymin, ymax, zmin, zmax), as in PyVista.
+        """
+        lower, upper = self._aabb()
+        return (lower[0], upper[0], lower[1], upper[1], lower[2], upper[2])
+    
+    def _aabb(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Get (min, max) corners enclosing the geometry, analytic if possible."""
+        data = self.data
+        half = self._half_extents() if data.analytic else None
+        if half is None:
+            lower, upper = self._bounds()
+            return lower.astype(np.float64), upper.astype(np.float64)
+        if data.placement is None:
+            return -half, half
+        # Box centered at the origin: the transformed box is centered at the
+        # translation, with extents projected through the rotation
+        rotation, center = data.placement[:3, :3], data.placement[:3, 3]
+        extent = np.abs(rotation) @ half
+        return center - extent, center + extent
+    
+    def _half_extents(self) -> Optional[np.ndarray]:
+        """Half sizes of the primitive's box in its local frame.
+        
+        Primitives are centered at the origin of their local frame.
+        Subclasses with analytic parameters override this.
+        
+        Returns:
+            (3,) array of half extents, or None if unknown.
+        """
+        return None
+    
+    def _bounds(self) -> np.ndarray:
+        """Get the (min, max) corners of the mesh points.
+        
+        Returns:
+            (2, 3) array, cached until the mesh or its points change.
+        """
+        points, _ = self._arrays()
+        data = self.data
+        if data._bounds_key != data._arrays_key:
+            data._bounds_cache = np.stack([points.min(axis=0), points.max(axis=0)])
+            data._bounds_key = data._arrays_key
+        return data._bounds_cache
+    
+    def _arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the triangulated mesh as plain NumPy arrays.
+        
+        The arrays are cached on the geometry data, so hot paths (bounds,
+        export, booleans) skip the PyVista wrappers and the reshaping of
+        the VTK face array after the first call.
+        
+        Returns:
+            Tuple of (N, 3) float32 points and (F, 3) int64 triangles.
+        """
+        mesh = _ensure_tri(self)
+        data = self.data
+        key = _mesh_key(mesh)
+        if data._arrays_key != key:
+            data.points = np.asarray(mesh.points)
+            data.tris = np.ascontiguousarray(mesh.faces.reshape(-1, 4)[:, 1:])
+            data._arrays_key = key
+        return data.points, data.tris
     
     def translate(self, x: float, y: float, z: float) -> "Geometry":
         """Translate the geometry along (x, y, z) axes.
@@ -119,9 +494,7 @@ class Geometry:
         Returns:
             A new Geometry instance translated.
         """
-        mesh = self.to_pyvista()
-        translated = mesh.translate((x, y, z))
-        return self.from_pyvista(translated)
+        return self._transform(translation=np.array([x, y, z]))
     
     def rotate(self, angle: float, axis: Tuple[float, float, float]) -> "Geometry":
         """Rotate the geometry.
@@ -133,15 +506,99 @@ class Geometry:
         Returns:
             A new Geometry instance rotated.
         """
-        mesh = self.to_pyvista()
-        rotated = mesh.rotate_vector(axis, angle)
-        return self.from_pyvista(rotated)
+        return self._transform(rotation=_rotation_matrix(angle, axis))
+    
+    def transform(self, matrix: np.ndarray) -> "Geometry":
+        """Apply a rigid transform given as a 4x4 matrix.
+        
+        A combined rotation and translation is applied in one step, instead
+        of chaining rotate() and translate(). Scaling and shearing are not
+        accepted, since the geometry keeps its intrinsic parameters.
+        
+        Args:
+            matrix: 4x4 matrix acting on column vectors (x, y, z, 1).
+        
+        Returns:
+            A new transformed Geometry instance.
+        
+        Raises:
+            ValueError: If the matrix is not a 4x4 rigid transform.
+        """
+        matrix = np.array(matrix, dtype=np.float64)
+        if matrix.shape != (4, 4) or not _is_rigid(matrix):
+            raise ValueError("Transform must be a 4x4 rigid transformation matrix")
+        return self._compose(matrix)
+    
+    def _transform(self, rotation: Optional[np.ndarray] = None,
+                   translation: Optional[np.ndarray] = None) -> "Geometry":
+        """Record a rigid transform to be applied to the mesh points.
+        
+        Points are mapped as ``points @ rotation.T + translation``.
+        
+        Args:
+            rotation: 3x3 rotation matrix, or None for no rotation.
+            translation: Translation vector (x, y, z), or None for no translation.
+        
+        Returns:
+            A new transformed Geometry instance.
+        """
+        matrix = np.eye(4)
+        if rotation is not None:
+            matrix[:3, :3] = rotation
+        if translation is not None:
+            matrix[:3, 3] = translation
+        return self._compose(matrix)
+    
+    def _compose(self, matrix: np.ndarray) -> "Geometry":
+        """Record an affine transform to be applied to the mesh points.
+        
+        The transform is composed with any pending one and only applied when
+        the mesh is requested, so chains of translations and rotations cost
+        a single pass over the points. The new geometry shares the mesh of
+        this one and keeps its type and intrinsic parameters. A result that
+        is the identity is stored as None, so it costs nothing to apply.
+        
+        Args:
+            matrix: 4x4 affine matrix, not modified.
+        
+        Returns:
+            A new transformed Geometry instance.
+        """
+        data = self.data
+        placement = matrix
+        if data.placement is not None:
+            placement = matrix @ data.placement
+        if data.pending_transform is not None:
+            matrix = matrix @ data.pending_transform
+        if np.allclose(placement, _IDENTITY):
+            placement = None
+        if np.allclose(matrix, _IDENTITY):
+            matrix = None
+        
+        result = type(self)()
+        result._data = GeometryData(
+            type=data.type,
+            parameters=dict(data.parameters),
+            mesh=data.mesh,
+            is_triangulated=data.is_triangulated,
+            pending_transform=matrix,
+            analytic=data.analytic,
+            placement=placement
+        )
+        return result
     
     def clone(self) -> "Geometry":
         """Create a clone of the geometry.
         
+        The clone shares the mesh of this geometry through an explicit
+        identity pending transform, so cloning itself copies nothing. The
+        clone gets its own copy of the points the first time its mesh is
+        requested; the cell connectivity stays shared.
+        
         Returns:
             A new cloned instance of the Geometry.
         """
-        mesh = self.to_pyvista()
-        return self.from_pyvista(mesh.copy(deep=True))
+        result = self._transform()
+        if result.data.pending_transform is None:
+            result.data.pending_transform = np.eye(4)
+        return result
@@ -1,12 +1,107 @@
 """Primitive geometry implementations."""
 
-import pyvista as pv
-from .base import Geometry, GeometryData, GeometryValidationError
+from __future__ import annotations
+
+import math
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Optional, Tuple
+import numpy as np
+from .base import (Geometry, GeometryData, GeometryValidationError, _VALIDATE_MESHES,
+                   _to_float32_points, _tris_to_vtk_faces)
 from .types import GeometryType
 
+if TYPE_CHECKING:  # PyVista loads VTK, so it is imported where meshes are built
+    import pyvista as pv
+
+# Unit box centered at origin: corners numbered bottom (z = -0.5) then
+# top, counter-clockwise seen from above, and two outward triangles per side
+_BOX_POINTS = np.array([
+    [-0.5, -0.5, -0.5], [0.5, -0.5, -0.5], [0.5, 0.5, -0.5], [-0.5, 0.5, -0.5],
+    [-0.5, -0.5, 0.5], [0.5, -0.5, 0.5], [0.5, 0.5, 0.5], [-0.5, 0.5, 0.5],
+], dtype=np.float32)
+_BOX_FACES = _tris_to_vtk_faces(np.array([
+    [0, 2, 1], [0, 3, 2],  # Bottom (-Z)
+    [4, 5, 6], [4, 6, 7],  # Top (+Z)
+    [0, 1, 5], [0, 5, 4],  # Front (-Y)
+    [3, 7, 6], [3, 6, 2],  # Back (+Y)
+    [0, 4, 7], [0, 7, 3],  # Left (-X)
+    [1, 2, 6], [1, 6, 5],  # Right (+X)
+]))
+
+@lru_cache(maxsize=8)
+def _build_cylinder_template(resolution: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Build the unit cylinder mesh arrays with NumPy.
+    
+    The arrays are cached per resolution and must not be modified. The
+    cylinder has radius 1 and height 1, is centered at origin and
+    aligned with the Z axis. Points are the bottom ring followed by the
+    top ring; the caps are triangle fans over the ring points and all
+    triangles are wound so their normals point outwards.
+    
+    Args:
+        resolution: Number of points in circular discretization
+        
+    Returns:
+        Tuple of (2 * resolution, 3) float32 points and the VTK face array.
+    """
+    n = resolution
+    angles = np.linspace(0.0, 2.0 * np.pi, n, endpoint=False)
+    circle = np.stack([np.cos(angles), np.sin(angles)], axis=-1)
+    points = np.empty((2 * n, 3), dtype=np.float32)
+    points[:n, :2] = circle
+    points[n:, :2] = circle
+    points[:n, 2] = -0.5
+    points[n:, 2] = 0.5
+    
+    i = np.arange(n)
+    j = (i + 1) % n
+    k = np.arange(1, n - 1)
+    triangles = np.concatenate([
+        np.stack([i, j, n + j], axis=1),                  # Side, lower half
+        np.stack([i, n + j, n + i], axis=1),              # Side, upper half
+        np.stack([np.zeros_like(k), k + 1, k], axis=1),   # Bottom cap
+        np.stack([np.full_like(k, n), n + k, n + k + 1], axis=1),  # Top cap
+    ])
+    return points, _tris_to_vtk_faces(triangles)
+
+# Number of points around the circle of a Cylinder mesh
+_CYLINDER_RESOLUTION = 32
+
+def _rounded(*values: float) -> Tuple[float, ...]:
+    """Round primitive parameters so equal dimensions share a cache key."""
+    return tuple(round(float(value), 9) for value in values)
+
+@lru_cache(maxsize=256)
+def _cached_box(width: float, height: float, depth: float) -> pv.PolyData:
+    """Get the triangulated box mesh for the given dimensions.
+    
+    The mesh is shared between calls and must not be modified.
+    """
+    import pyvista as pv
+    
+    # Scale the constant unit box instead of running the VTK box source
+    points = _BOX_POINTS * np.array([width, height, depth], dtype=np.float32)
+    return pv.PolyData(points, _BOX_FACES)
+
+@lru_cache(maxsize=256)
+def _cached_cylinder(radius: float, height: float, resolution: int) -> pv.PolyData:
+    """Get the triangulated cylinder mesh for the given dimensions.
+    
+    The mesh is shared between calls and must not be modified.
+    """
+    import pyvista as pv
+    
+    # Scale the precomputed unit cylinder (center at origin, aligned
+    # with Z axis) instead of running the VTK cylinder source
+    unit_points, faces = _build_cylinder_template(resolution)
+    points = unit_points * np.array([radius, radius, height], dtype=np.float32)
+    return pv.PolyData(points, faces)
+
 class Box(Geometry):
     """Geometry implementation for a box primitive using PyVista."""
     
+    __slots__ = ()
+    
     def __init__(self, width: float = None, height: float = None, depth: float = None) -> None:
         """Initialize a box with given dimensions.
         
@@ -30,15 +125,18 @@ class Box(Geometry):
                     "width": width,
                     "height": height,
                     "depth": depth
-                }
+                },
+                analytic=True
             )
     
     @classmethod
-    def from_pyvista(cls, mesh: pv.PolyData) -> "Box":
+    def from_pyvista(cls, mesh: pv.PolyData, *, validate: bool = True) -> "Box":
         """Create a box from a PyVista mesh.
         
         Args:
-            mesh: PyVista mesh to convert
+            mesh: PyVista mesh to convert, left unchanged; float64 points are
+                converted to float32 on a shallow copy
+            validate: Whether to validate the mesh
             
         Returns:
             New Box instance
@@ -46,8 +144,10 @@ class Box(Geometry):
         Raises:
             GeometryValidationError: If mesh is invalid
         """
-        if not cls._validate_mesh(mesh):
-            raise GeometryValidationError("Invalid mesh provided")
+        # Validation is skipped entirely with python -O or CAD_VALIDATE=0
+        if __debug__ and _VALIDATE_MESHES and validate and not cls._validate_mesh(mesh):
+            reason = cls._validate_mesh_verbose(mesh)
+            raise GeometryValidationError(f"Invalid mesh provided: {reason}")
             
         bounds = mesh.bounds
         width = bounds[1] - bounds[0]
@@ -62,7 +162,7 @@ class Box(Geometry):
                 "height": height,
                 "depth": depth
             },
-            mesh=mesh
+            mesh=_to_float32_points(mesh)
         )
         return instance
     
@@ -72,14 +172,20 @@ class Box(Geometry):
         height = self.data.parameters["height"]
         depth = self.data.parameters["depth"]
         
-        # Create box using PyVista's built-in box primitive centered at origin
-        box = pv.Box(
-            bounds=(-width/2, width/2,
-                   -height/2, height/2,
-                   -depth/2, depth/2)
-        )
-        # Ensure mesh is triangulated
-        self._data.mesh = box.triangulate()
+        # Repeated dimensions (e.g. arrays of identical parts) reuse the
+        # mesh built for the first one
+        self._data.mesh = _cached_box(*_rounded(width, height, depth)).copy(deep=True)
+        self._data.is_triangulated = True
+    
+    def _half_extents(self) -> np.ndarray:
+        """Half sizes of the box, centered at the origin."""
+        params = self.data.parameters
+        return 0.5 * np.array([params["width"], params["height"], params["depth"]], dtype=np.float64)
+    
+    def _analytic_volume(self) -> float:
+        """Volume of the box."""
+        params = self.data.parameters
+        return float(params["width"] * params["height"] * params["depth"])
     
     @property
     def width(self) -> float:
@@ -100,6 +206,8 @@ class Box(Geometry):
 class Cylinder(Geometry):
     """Geometry implementation for a cylinder primitive using PyVista."""
     
+    __slots__ = ()
+    
     def __init__(self, radius: float = None, height: float = None) -> None:
         """Initialize a cylinder with given dimensions.
         
@@ -121,15 +229,18 @@ class Cylinder(Geometry):
                 parameters={
                     "radius": radius,
                     "height": height
-                }
+                },
+                analytic=True
             )
             
     @classmethod
-    def from_pyvista(cls, mesh: pv.PolyData) -> "Cylinder":
+    def from_pyvista(cls, mesh: pv.PolyData, *, validate: bool = True) -> "Cylinder":
         """Create a cylinder from a PyVista mesh.
         
         Args:
-            mesh: PyVista mesh to convert
+            mesh: PyVista mesh to convert, left unchanged; float64 points are
+                converted to float32 on a shallow copy
+            validate: Whether to validate the mesh
             
         Returns:
             New Cylinder instance
@@ -137,8 +248,10 @@ class Cylinder(Geometry):
         Raises:
             GeometryValidationError: If mesh is invalid
         """
-        if not cls._validate_mesh(mesh):
-            raise GeometryValidationError("Invalid mesh provided")
+        # Validation is skipped entirely with python -O or CAD_VALIDATE=0
+        if __debug__ and _VALIDATE_MESHES and validate and not cls._validate_mesh(mesh):
+            reason = cls._validate_mesh_verbose(mesh)
+            raise GeometryValidationError(f"Invalid mesh provided: {reason}")
         
         bounds = mesh.bounds
         # Estimate radius as half the minimum of width/depth
@@ -152,7 +265,7 @@ class Cylinder(Geometry):
                 "radius": radius,
                 "height": height
             },
-            mesh=mesh
+            mesh=_to_float32_points(mesh)
         )
         return instance
     
@@ -161,17 +274,25 @@ class Cylinder(Geometry):
         radius = self.data.parameters["radius"]
         height = self.data.parameters["height"]
         
-        # Create cylinder using PyVista's built-in cylinder primitive
-        # Center at origin, aligned with Z axis
-        cylinder = pv.Cylinder(
-            radius=radius,
-            height=height,
-            center=(0, 0, 0),
-            direction=(0, 0, 1),
-            resolution=32  # Number of points in circular discretization
-        )
-        # Ensure mesh is triangulated
-        self._data.mesh = cylinder.triangulate()
+        self._data.mesh = _cached_cylinder(*_rounded(radius, height), _CYLINDER_RESOLUTION).copy(deep=True)
+        self._data.is_triangulated = True
+    
+    def _half_extents(self) -> np.ndarray:
+        """Half sizes of the box around the cylinder, centered at the origin."""
+        params = self.data.parameters
+        radius = params["radius"]
+        return np.array([radius, radius, 0.5 * params["height"]], dtype=np.float64)
+    
+    def _analytic_volume(self) -> float:
+        """Volume of the meshed cylinder.
+        
+        The mesh is a prism over a regular polygon inscribed in the circle,
+        so this matches the mesh volume rather than pi * r^2 * h.
+        """
+        params = self.data.parameters
+        n = _CYLINDER_RESOLUTION
+        area = 0.5 * n * math.sin(2.0 * math.pi / n) * params["radius"] ** 2
+        return float(area * params["height"])
     
     @property
     def radius(self) -> float:
@@ -182,3 +303,38 @@ class Cylinder(Geometry):
     def height(self) -> float:
         """Get cylinder height."""
         return self.data.parameters["height"]
+
+
+class Points:
+    """An ordered set of point positions outlining a polygon."""
+    
+    def __init__(self, positions: List[np.ndarray]) -> None:
+        """Initialize the point set.
+        
+        Positions are stored once as a contiguous (N, 3) float32 array, the
+        precision used for all geometry, so consumers need no conversion.
+        
+        Args:
+            positions: Point positions in outline order.
+        """
+        self.positions: np.ndarray = np.ascontiguousarray(
+            np.reshape(positions, (-1, 3)), dtype=np.float32)
+        self._triangles: Optional[np.ndarray] = None
+    
+    def triangle_indices(self) -> np.ndarray:
+        """Get the fan triangulation of the outline.
+        
+        The fan is built on first use and cached, since the positions do
+        not change after construction.
+        
+        Returns:
+            (N - 2, 3) int32 indices into positions, fanned from the first
+            point; empty for fewer than three points.
+        """
+        if self._triangles is None:
+            count = max(len(self.positions) - 2, 0)
+            triangles = np.zeros((count, 3), dtype=np.int32)
+            triangles[:, 1] = np.arange(1, count + 1, dtype=np.int32)
+            triangles[:, 2] = triangles[:, 1] + 1
+            self._triangles = triangles
+        return self._triangles
@@ -0,0 +1,256 @@
+"""Interchangeable backends for boolean operations."""
+
+from __future__ import annotations
+
+import os
+import warnings
+from typing import TYPE_CHECKING, Dict, List, Type
+import numpy as np
+from ..geometry.base import (Geometry, GeometryError, _ensure_tri, _is_all_tris, _mesh_key,
+                             _tris_to_vtk_faces)
+
+try:
+    import manifold3d
+except ImportError:  # Optional dependency for fast boolean operations
+    manifold3d = None
+
+try:
+    import trimesh
+except ImportError:  # Optional dependency, uses whichever boolean engine it finds
+    trimesh = None
+
+if TYPE_CHECKING:
+    import pyvista as pv
+
+def _mesh_result(mesh: pv.PolyData) -> Geometry:
+    """Wrap a triangulated boolean result mesh in a Geometry."""
+    geometry = Geometry.from_pyvista(mesh)
+    geometry.data.is_triangulated = True
+    return geometry
+
+def _vtk_boolean(mesh_a: pv.PolyData, mesh_b: pv.PolyData, operation: str) -> pv.PolyData:
+    """Run a boolean operation on two triangulated meshes with VTK.
+    
+    Args:
+        mesh_a: First mesh
+        mesh_b: Second mesh
+        operation: One of 'union', 'difference', 'intersection'
+        
+    Returns:
+        The triangulated result mesh
+    """
+    if operation == 'union':
+        result_mesh = mesh_a.boolean_union(mesh_b)
+    elif operation == 'difference':
+        result_mesh = mesh_a.boolean_difference(mesh_b)
+    else:  # intersection
+        result_mesh = mesh_a.boolean_intersection(mesh_b)
+    
+    # Ensure result is triangulated; the result is a fresh mesh owned by
+    # nobody else, so it can be triangulated in place
+    if not _is_all_tris(result_mesh):
+        result_mesh.triangulate(inplace=True)
+    return result_mesh
+
+def _manifold_solid(geometry: Geometry) -> "manifold3d.Manifold":
+    """Get the manifold3d solid of a geometry.
+    
+    The solid, including the acceleration structures manifold3d builds for
+    it, is cached on the geometry data, so a base part used in many boolean
+    operations is only converted once.
+    
+    Args:
+        geometry: Geometry to convert
+        
+    Returns:
+        The manifold3d solid
+        
+    Raises:
+        GeometryError: If the mesh is not a closed manifold
+    """
+    data = geometry.data
+    key = _mesh_key(_ensure_tri(geometry))
+    if data._manifold_key != key:
+        solid = manifold3d.Manifold(geometry.to_manifold())
+        if solid.status() != manifold3d.Error.NoError:
+            raise GeometryError(f"Input is not a valid manifold: {solid.status()}")
+        data._manifold = solid
+        data._manifold_key = key
+    return data._manifold
+
+class VtkBackend:
+    """Boolean operations with VTK through PyVista.
+    
+    VTK only combines two meshes at a time, so operands are applied one
+    after the other on a single working mesh.
+    """
+    
+    name = "vtk"
+    batched = False
+    
+    def apply(self, geometries: List[Geometry], operation: str) -> Geometry:
+        """Combine the operands from left to right.
+        
+        Args:
+            geometries: Operands, the first one is the base for 'difference'
+            operation: One of 'union', 'difference', 'intersection'
+            
+        Returns:
+            A new Geometry instance with the triangulated result
+        """
+        mesh = _ensure_tri(geometries[0])
+        for geometry in geometries[1:]:
+            mesh = _vtk_boolean(mesh, _ensure_tri(geometry), operation)
+        return _mesh_result(mesh)
+    
+    def prepare(self, geometry: Geometry) -> None:
+        """Build and cache the triangulated mesh apply() reads from an operand."""
+        _ensure_tri(geometry)
+
+class Manifold3dBackend:
+    """Boolean operations with manifold3d.
+    
+    All operands go to manifold3d in one batch, so intermediate results are
+    never converted back to meshes, and the solids are cached on the inputs.
+    """
+    
+    name = "manifold3d"
+    batched = True
+    
+    def apply(self, geometries: List[Geometry], operation: str) -> Geometry:
+        """Combine all operands in one batch.
+        
+        Args:
+            geometries: Operands, the first one is the base for 'difference'
+            operation: One of 'union', 'difference', 'intersection'
+            
+        Returns:
+            A new Geometry instance with the triangulated result
+            
+        Raises:
+            GeometryError: If an input is not a closed manifold mesh
+        """
+        import pyvista as pv
+        
+        solids = [_manifold_solid(geometry) for geometry in geometries]
+        op_type = {
+            'union': manifold3d.OpType.Add,
+            'difference': manifold3d.OpType.Subtract,
+            'intersection': manifold3d.OpType.Intersect,
+        }[operation]
+        result = manifold3d.Manifold.batch_boolean(solids, op_type)
+        
+        mesh = result.to_mesh()
+        points = np.asarray(mesh.vert_properties, dtype=np.float32)[:, :3]
+        geometry = _mesh_result(pv.PolyData(points, _tris_to_vtk_faces(mesh.tri_verts)))
+        data = geometry.data
+        # Keep the solid so chained operations on the result skip the conversion
+        data._manifold = result
+        data._manifold_key = _mesh_key(data.mesh)
+        return geometry
+    
+    def prepare(self, geometry: Geometry) -> None:
+        """Build and cache the manifold3d solid apply() reads from an operand."""
+        _manifold_solid(geometry)
+
+class TrimeshBackend:
+    """Boolean operations with trimesh.
+    
+    trimesh picks the best boolean engine it has available (manifold3d or
+    Blender) and evaluates all operands in one call.
+    """
+    
+    name = "trimesh"
+    batched = True
+    
+    def apply(self, geometries: List[Geometry], operation: str) -> Geometry:
+        """Combine all operands in one call.
+        
+        Args:
+            geometries: Operands, the first one is the base for 'difference'
+            operation: One of 'union', 'difference', 'intersection'
+            
+        Returns:
+            A new Geometry instance with the triangulated result
+        """
+        import pyvista as pv
+        
+        meshes = []
+        for geometry in geometries:
+            points, triangles = geometry._arrays()
+            meshes.append(trimesh.Trimesh(vertices=points, faces=triangles, process=False))
+        
+        combine = {
+            'union': trimesh.boolean.union,
+            'difference': trimesh.boolean.difference,
+            'intersection': trimesh.boolean.intersection,
+        }[operation]
+        result = combine(meshes)
+        
+        points = np.asarray(result.vertices, dtype=np.float32)
+        return _mesh_result(pv.PolyData(points, _tris_to_vtk_faces(result.faces)))
+    
+    def prepare(self, geometry: Geometry) -> None:
+        """Build and cache the mesh arrays apply() reads from an operand."""
+        geometry._arrays()
+
+# Backends by name, and the optional modules some of them need
+_BACKENDS: Dict[str, Type] = {
+    VtkBackend.name: VtkBackend,
+    Manifold3dBackend.name: Manifold3dBackend,
+    TrimeshBackend.name: TrimeshBackend,
+}
+_REQUIRES = {
+    Manifold3dBackend.name: manifold3d,
+    TrimeshBackend.name: trimesh,
+}
+# Short names accepted in addition to the backend names
+_ALIASES = {"manifold": Manifold3dBackend.name}
+
+_backend = Manifold3dBackend() if manifold3d is not None else VtkBackend()
+
+def get_backend():
+    """Get the backend used for boolean operations.
+    
+    Returns:
+        The active backend instance.
+    """
+    return _backend
+
+def set_backend(name: str) -> None:
+    """Select the backend used for boolean operations.
+    
+    By default manifold3d is used when it is installed and VTK otherwise;
+    the CAD_BOOL_BACKEND environment variable overrides the default.
+    
+    Args:
+        name: One of 'vtk', 'manifold3d' (or 'manifold'), 'trimesh'.
+    
+    Raises:
+        ValueError: If the backend name is unknown.
+        GeometryError: If the backend's package is not installed.
+    """
+    global _backend
+    name = _ALIASES.get(name, name)
+    backend_cls = _BACKENDS.get(name)
+    if backend_cls is None:
+        raise ValueError(f"Unknown boolean backend: {name}")
+    if name in _REQUIRES and _REQUIRES[name] is None:
+        raise GeometryError(f"{name} is required for the '{name}' boolean backend")
+    _backend = backend_cls()
+
+def _apply_env_backend() -> None:
+    """Select the backend named by CAD_BOOL_BACKEND, if it is set.
+    
+    An unknown or unavailable backend only warns and keeps the default, so
+    a bad value does not make importing the package fail.
+    """
+    name = os.getenv("CAD_BOOL_BACKEND")
+    if not name:
+        return
+    try:
+        set_backend(name)
+    except (ValueError, GeometryError) as e:
+        warnings.warn(f"Ignoring CAD_BOOL_BACKEND={name!r}: {e}", RuntimeWarning)
+
+_apply_env_backend()
@@ -1,19 +1,93 @@
 """Boolean operations for geometric parts."""
 
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple, TypeVar
+import numpy as np
 from ...part.base import Part
-from ..geometry.base import Geometry, GeometryError
+from ..geometry.base import Geometry, _tris_to_vtk_faces
+from ..geometry.types import BooleanOperationError, GeometryError
+from ._backends import _mesh_result, get_backend, set_backend
+
+_T = TypeVar("_T")
+
+def _cascade_reduce(items: List[_T], op: Callable[[_T, _T], _T]) -> _T:
+    """Reduce items pairwise in balanced rounds.
+    
+    Combines (a, b), (c, d), ... and repeats on the results, so the inputs
+    of each operation stay similar in size instead of one accumulator
+    growing with every step as in a left fold.
+    
+    Args:
+        items: Non-empty list of items to combine.
+        op: Binary operation to apply.
+    
+    Returns:
+        The combined result.
+    """
+    while len(items) > 1:
+        paired = [op(items[i], items[i + 1]) for i in range(0, len(items) - 1, 2)]
+        if len(items) % 2:
+            paired.append(items[-1])
+        items = paired
+    return items[0]
 
-class BooleanOperationError(GeometryError):
-    """Exception raised when a boolean operation fails."""
-    pass
+def _aabbs_overlap(a: Geometry, b: Geometry) -> bool:
+    """Check whether the axis-aligned bounding boxes of two geometries meet.
+    
+    Boxes that only touch count as overlapping, so the full operation still
+    runs for parts that share a face. Primitives are tested with their
+    analytic bounds, so disjoint inputs are detected without meshing them.
+    """
+    (a_min, a_max), (b_min, b_max) = a._aabb(), b._aabb()
+    return bool(np.all(a_min <= b_max) and np.all(b_min <= a_max))
+
+def _merge_disjoint(a: Geometry, b: Geometry) -> Geometry:
+    """Union two geometries whose bounding boxes do not overlap.
+    
+    The union of disjoint solids is just both meshes, so the points and
+    triangles are concatenated instead of running a boolean operation.
+    """
+    import pyvista as pv
+    
+    points_a, tris_a = a._arrays()
+    points_b, tris_b = b._arrays()
+    points = np.concatenate([points_a, points_b])
+    triangles = np.concatenate([tris_a, tris_b + len(points_a)])
+    return _mesh_result(pv.PolyData(points, _tris_to_vtk_faces(triangles)))
+
+def _simplify(geometry: Geometry, tolerance: float) -> Geometry:
+    """Remove sliver triangles from a boolean result.
+    
+    Points closer than the tolerance are merged and the triangles that
+    collapse are dropped, so slivers do not pile up over chains of
+    operations.
+    
+    Args:
+        geometry: Triangulated boolean result
+        tolerance: Absolute distance below which points are merged
+        
+    Returns:
+        A new Geometry instance with the cleaned mesh
+    """
+    mesh = geometry.to_pyvista().clean(tolerance=tolerance, absolute=True,
+                                       polys_to_lines=False, lines_to_points=False)
+    return _mesh_result(mesh)
 
-def boolean_operation(a: Part, b: Part, operation: str) -> Part:
-    """Base function for boolean operations using PyVista.
+def boolean_operation(a: Part, b: Part, operation: str, *,
+                      simplify: Optional[float] = None) -> Part:
+    """Base function for boolean operations.
+    
+    The work is done by the active backend, see set_backend().
     
     Args:
         a: First part
         b: Second part
         operation: One of 'union', 'difference', 'intersection'
+        simplify: Optional tolerance for merging nearby points of the
+            result, which removes sliver triangles
         
     Returns:
         A new Part instance representing the operation result
@@ -25,38 +99,132 @@ def boolean_operation(a: Part, b: Part, operation: str) -> Part:
     if operation not in {'union', 'difference', 'intersection'}:
         raise ValueError(f"Invalid boolean operation: {operation}")
     
+    # Create new part with operation-specific name
+    result_name = f"{a.name}_{operation}_{b.name}"
     try:
-        # Get PyVista meshes and ensure they're triangulated
-        mesh_a = a.geometry.to_pyvista().triangulate()
-        mesh_b = b.geometry.to_pyvista().triangulate()
+        # Parts that cannot touch need no boolean operation at all
+        if not _aabbs_overlap(a.geometry, b.geometry):
+            if operation == 'difference':
+                return Part(result_name, a.geometry.clone())
+            if operation == 'intersection':
+                raise BooleanOperationError("Parts do not intersect")
+            return Part(result_name, _merge_disjoint(a.geometry, b.geometry))
         
-        # Perform the requested operation
-        if operation == 'union':
-            result_mesh = mesh_a.boolean_union(mesh_b)
-        elif operation == 'difference':
-            result_mesh = mesh_a.boolean_difference(mesh_b)
-        else:  # intersection
-            result_mesh = mesh_a.boolean_intersection(mesh_b)
+        result = get_backend().apply([a.geometry, b.geometry], operation)
         
-        # Ensure result is triangulated
-        result_mesh = result_mesh.triangulate()
+        if simplify is not None:
+            result = _simplify(result, simplify)
+        return Part(result_name, result)
         
-        # Create a new geometry from result
-        result_geom = Geometry.from_pyvista(result_mesh)
+    except Exception as e:
+        raise BooleanOperationError(f"Boolean operation failed: {str(e)}")
+
+def nary_difference(base: Part, tools: List[Part], *,
+                    simplify: Optional[float] = None) -> Part:
+    """Subtract several parts from a base part in one operation.
+    
+    Batched backends evaluate all operands in a single call. The VTK
+    backend still subtracts one part at a time, but keeps one working
+    mesh instead of wrapping every intermediate result in a Part.
+    
+    Args:
+        base: The Part instance from which to subtract.
+        tools: The Part instances to subtract.
+        simplify: Optional tolerance for removing sliver triangles from
+            the result.
+    
+    Returns:
+        A new Part instance representing the difference.
+    
+    Raises:
+        BooleanOperationError: If operation fails.
+    """
+    result_name = base.name + "".join(f"_difference_{tool.name}" for tool in tools)
+    try:
+        # Tools that cannot touch the base do not change it
+        tools = [tool for tool in tools if _aabbs_overlap(base.geometry, tool.geometry)]
+        if not tools:
+            return Part(result_name, base.geometry.clone())
+        
+        geometries = [base.geometry] + [tool.geometry for tool in tools]
+        result = get_backend().apply(geometries, 'difference')
         
-        # Create new part with operation-specific name
-        result_name = f"{a.name}_{operation}_{b.name}"
-        return Part(result_name, result_geom)
+        if simplify is not None:
+            result = _simplify(result, simplify)
+        return Part(result_name, result)
         
     except Exception as e:
         raise BooleanOperationError(f"Boolean operation failed: {str(e)}")
 
-def union(a: Part, b: Part) -> Part:
+def _prepare(operations: List[Tuple[Part, Part, str]]) -> None:
+    """Fill the caches boolean_operation reads from its operands.
+    
+    Each distinct geometry gets its bounds, and the mesh arrays or backend
+    solid the operation will need, so running the operations afterwards
+    only reads the geometry data.
+    
+    Args:
+        operations: (a, b, operation) triples as taken by boolean_operation.
+    
+    Raises:
+        BooleanOperationError: If an operand cannot be meshed or converted.
+    """
+    backend = get_backend()
+    prepared = set()
+    try:
+        for a, b, operation in operations:
+            geometries = (a.geometry, b.geometry)
+            if _aabbs_overlap(*geometries):
+                for geometry in geometries:
+                    if id(geometry) not in prepared:
+                        backend.prepare(geometry)
+                        prepared.add(id(geometry))
+            elif operation == 'union':
+                for geometry in geometries:
+                    geometry._arrays()  # Read by _merge_disjoint
+    except GeometryError as e:
+        raise BooleanOperationError(f"Boolean operation failed: {str(e)}")
+
+def batch_boolean(operations: List[Tuple[Part, Part, str]]) -> List[Part]:
+    """Run independent boolean operations concurrently.
+    
+    The operations run on a thread pool, after the inputs have been meshed
+    serially on the calling thread. This only speeds things up with
+    backends that release the GIL while they compute (manifold3d, and
+    trimesh with the manifold engine); with VTK they effectively run one
+    after the other.
+    
+    Args:
+        operations: (a, b, operation) triples as taken by boolean_operation.
+    
+    Returns:
+        The result parts, in the order of the operations.
+    
+    Raises:
+        BooleanOperationError: If any operation fails.
+        ValueError: If an operation type is invalid.
+    """
+    if len(operations) < 2:
+        return [boolean_operation(a, b, operation) for a, b, operation in operations]
+    workers = min(len(operations), os.cpu_count() or 1)
+    if workers < 2:
+        return [boolean_operation(a, b, operation) for a, b, operation in operations]
+    
+    # Operations often share inputs (one base, many tools), and materializing
+    # a geometry writes its cached mesh, arrays and solid without a lock. Do
+    # that here, serially, so the workers only read them.
+    _prepare(operations)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda args: boolean_operation(*args), operations))
+
+def union(a: Part, b: Part, *, simplify: Optional[float] = None) -> Part:
     """Perform a union operation on two parts.
     
     Args:
         a: The first Part instance.
         b: The second Part instance.
+        simplify: Optional tolerance for removing sliver triangles from
+            the result.
     
     Returns:
         A new Part instance representing the union.
@@ -64,14 +232,45 @@ def union(a: Part, b: Part) -> Part:
     Raises:
         BooleanOperationError: If operation fails.
     """
-    return boolean_operation(a, b, 'union')
+    return boolean_operation(a, b, 'union', simplify=simplify)
+
+def union_all(parts: List[Part]) -> Part:
+    """Perform a union operation on any number of parts.
+    
+    Batched backends combine all parts in a single call, otherwise they are
+    unioned pairwise in balanced rounds.
+    
+    Args:
+        parts: The Part instances to combine.
+    
+    Returns:
+        A new Part instance representing the union of all parts.
+    
+    Raises:
+        ValueError: If no parts are given.
+        BooleanOperationError: If operation fails.
+    """
+    if not parts:
+        raise ValueError("union_all requires at least one part")
+    backend = get_backend()
+    if not backend.batched or len(parts) == 1:
+        return _cascade_reduce(list(parts), union)
+    
+    result_name = _cascade_reduce([part.name for part in parts],
+                                  lambda a, b: f"{a}_union_{b}")
+    try:
+        return Part(result_name, backend.apply([part.geometry for part in parts], 'union'))
+    except Exception as e:
+        raise BooleanOperationError(f"Boolean operation failed: {str(e)}")
 
-def difference(a: Part, b: Part) -> Part:
+def difference(a: Part, b: Part, *, simplify: Optional[float] = None) -> Part:
     """Perform a difference operation (subtraction) on two parts.
     
     Args:
         a: The Part instance from which to subtract.
         b: The Part instance to subtract.
+        simplify: Optional tolerance for removing sliver triangles from
+            the result.
     
     Returns:
         A new Part instance representing the difference.
@@ -79,14 +278,16 @@ def difference(a: Part, b: Part) -> Part:
     Raises:
         BooleanOperationError: If operation fails.
     """
-    return boolean_operation(a, b, 'difference')
+    return boolean_operation(a, b, 'difference', simplify=simplify)
 
-def intersection(a: Part, b: Part) -> Part:
+def intersection(a: Part, b: Part, *, simplify: Optional[float] = None) -> Part:
     """Perform an intersection operation on two parts.
     
     Args:
         a: The first Part instance.
         b: The second Part instance.
+        simplify: Optional tolerance for removing sliver triangles from
+            the result.
     
     Returns:
         A new Part instance representing the intersection.
@@ -94,4 +295,4 @@ def intersection(a: Part, b: Part) -> Part:
     Raises:
         BooleanOperationError: If operation fails.
     """
-    return boolean_operation(a, b, 'intersection')
+    return boolean_operation(a, b, 'intersection', simplify=simplify)
@@ -1,6 +1,7 @@
 """Transformation operations for geometric parts."""
 
 from typing import Tuple
+import numpy as np
 from ...part.base import Part
 
 def transform_part(part: Part, transform_type: str, *args, **kwargs) -> Part:
@@ -8,7 +9,8 @@ def transform_part(part: Part, transform_type: str, *args, **kwargs) -> Part:
     
     Args:
         part: The Part instance to transform.
-        transform_type: Type of transformation ('translate' or 'rotate').
+        transform_type: Type of transformation ('translate', 'rotate' or
+            'matrix' for a 4x4 rigid transformation matrix).
         *args, **kwargs: Arguments passed to the specific transformation method.
     
     Returns:
@@ -28,6 +30,10 @@ def transform_part(part: Part, transform_type: str, *args, **kwargs) -> Part:
         if not isinstance(axis, tuple) or len(axis) != 3:
             raise ValueError("Rotation axis must be a tuple of (x, y, z)")
         return part.rotate(angle, axis)
+    elif transform_type == 'matrix':
+        if len(args) != 1:
+            raise ValueError("Matrix transformation requires a 4x4 matrix")
+        return part.with_transform(args[0])
     else:
         raise ValueError(f"Unknown transformation type: {transform_type}")
 
@@ -57,3 +63,18 @@ def rotate_part(part: Part, angle: float, axis: Tuple[float, float, float]) -> P
         A new rotated Part instance.
     """
     return transform_part(part, 'rotate', angle, axis)
+
+def matrix_transform_part(part: Part, matrix: np.ndarray) -> Part:
+    """Apply a rigid 4x4 transformation matrix to a part.
+    
+    A translation combined with a rotation is applied in a single pass over
+    the points, rather than one pass per translate_part/rotate_part call.
+    
+    Args:
+        part: The Part instance to transform.
+        matrix: 4x4 rigid transformation matrix acting on (x, y, z, 1).
+    
+    Returns:
+        A new transformed Part instance.
+    """
+    return transform_part(part, 'matrix', matrix)
@@ -1,36 +1,358 @@
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 import numpy as np
 from ..core.geometry.primitives import Points
-from ..core.geometry.base import Entity
+from ..core.geometry.base import Entity, _is_rigid
+from ..part.base import Part
+
+# Kinds of actions recorded in the document history
+_ACTION_ADD = 0
+
+class _ActionLog:
+    """Stack of document actions stored as parallel NumPy ring buffers.
+    
+    Each entry is an action kind and an int32 argument (an index into the
+    document's part registry), which keeps entries to a few bytes instead
+    of a tuple per action. With a maxlen the buffers stop growing at maxlen
+    entries and the oldest action is overwritten once the stack is full,
+    like a bounded deque, so every push is O(1).
+    """
+    
+    __slots__ = ("kinds", "args", "head", "size", "maxlen")
+    
+    def __init__(self, capacity: int = 16, maxlen: Optional[int] = None) -> None:
+        if maxlen is not None:
+            if maxlen < 1:
+                raise ValueError("maxlen must be at least 1.")
+            capacity = min(capacity, maxlen)
+        self.kinds = np.empty(capacity, dtype=np.int8)
+        self.args = np.empty(capacity, dtype=np.int32)
+        # Buffer index of the oldest action
+        self.head = 0
+        self.size = 0
+        self.maxlen = maxlen
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def _indices(self, start: int, stop: int) -> np.ndarray:
+        """Buffer indices of the actions from start to stop, oldest first."""
+        return (self.head + np.arange(start, stop)) % len(self.kinds)
+    
+    def push(self, kind: int, arg: int) -> Optional[int]:
+        """Append an action, doubling the capacity when full.
+        
+        Returns:
+            Argument of the oldest action if it was dropped to make room
+            for this one, otherwise None.
+        """
+        dropped = None
+        if self.size == len(self.kinds):
+            if self.size == self.maxlen:
+                dropped = int(self.args[self.head])
+                self.head = (self.head + 1) % self.size
+                self.size -= 1
+            else:
+                capacity = 2 * self.size
+                if self.maxlen is not None:
+                    capacity = min(capacity, self.maxlen)
+                # Unroll the ring into the new buffers, oldest action first
+                order = self._indices(0, self.size)
+                kinds = np.empty(capacity, dtype=np.int8)
+                args = np.empty(capacity, dtype=np.int32)
+                kinds[:self.size] = self.kinds[order]
+                args[:self.size] = self.args[order]
+                self.kinds, self.args, self.head = kinds, args, 0
+        slot = (self.head + self.size) % len(self.kinds)
+        self.kinds[slot] = kind
+        self.args[slot] = arg
+        self.size += 1
+        return dropped
+    
+    def pop(self, count: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """Remove up to count actions from the top of the stack.
+        
+        Returns:
+            Kinds and arguments of the removed actions, most recent first.
+        
+        Raises:
+            ValueError: If count is negative.
+        """
+        if count < 0:
+            raise ValueError("count must not be negative.")
+        start = max(self.size - count, 0)
+        order = self._indices(start, self.size)[::-1]
+        self.size = start
+        return self.kinds[order], self.args[order]
+    
+    def clear(self) -> np.ndarray:
+        """Remove all actions.
+        
+        Returns:
+            Arguments of the removed actions.
+        """
+        args = self.args[self._indices(0, self.size)]
+        self.head = self.size = 0
+        return args
+
+class _RowBuffer:
+    """Growable (N, columns) array, doubling its capacity when full."""
+    
+    __slots__ = ("data", "size")
+    
+    def __init__(self, columns: int, dtype: type, capacity: int = 64) -> None:
+        self.data = np.empty((capacity, columns), dtype=dtype)
+        self.size = 0
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def extend(self, rows: np.ndarray) -> None:
+        """Append rows, growing the buffer geometrically if needed."""
+        end = self.size + len(rows)
+        if end > len(self.data):
+            grown = np.empty((max(end, 2 * len(self.data)), self.data.shape[1]),
+                             dtype=self.data.dtype)
+            grown[:self.size] = self.data[:self.size]
+            self.data = grown
+        self.data[self.size:end] = rows
+        self.size = end
+    
+    def view(self) -> np.ndarray:
+        """Return the filled rows without copying."""
+        return self.data[:self.size]
 
 class Edge:
     def __init__(self, points: List[np.ndarray]):
-        self.points = points
+        # Stored as one contiguous (N, 3) block rather than a list of vectors
+        self.points = np.asarray(points, dtype=np.float32).reshape(-1, 3)
 
 class Document:
-    def __init__(self):
-        self.geometry = []
+    __slots__ = (
+        "name", "_geometry", "parts", "entities", "_by_name", "_registry",
+        "_positions", "_free_entries", "history", "redo_stack", "_vertices", "_faces",
+    )
+    
+    def __init__(self, name: str = "", max_history: Optional[int] = None):
+        self.name = name
+        # Exposed read-only so every addition goes through add_geometry,
+        # which keeps the vertex and face buffers in step
+        self._geometry: List[Entity] = []
         self.parts = []
         self.entities = []
+        # Name index for get_part; the first part added under a name wins
+        self._by_name: Dict[str, Part] = {}
+        # Parts referenced by history actions, addressed by index, and the
+        # position in self.parts each of them was added at
+        self._registry: List[Optional[Part]] = []
+        self._positions: List[int] = []
+        # Registry slots no longer referenced by any action, for reuse
+        self._free_entries: List[int] = []
+        # Undo and redo together never hold more than max_history actions:
+        # undo/redo move actions between them and add_part clears redo
+        self.history = _ActionLog(maxlen=max_history)
+        self.redo_stack = _ActionLog(maxlen=max_history)
+        # Vertices and fan faces of every Points geometry, kept contiguous
+        self._vertices = _RowBuffer(3, np.float32)
+        self._faces = _RowBuffer(3, np.int64)
+    
+    def add_part(self, part: Part) -> None:
+        """Add a part to the document.
+        
+        The addition is recorded in the history and clears the redo stack.
+        
+        Args:
+            part: The Part instance to add.
+        """
+        entry = self._register(part)
+        self._insert(part)
+        self._release(self.history.push(_ACTION_ADD, entry))
+        # Undone parts can no longer be redone, so stop pinning them
+        for entry in self.redo_stack.clear().tolist():
+            self._release(entry)
+    
+    def undo(self, steps: int = 1) -> int:
+        """Undo the most recent actions.
+        
+        Args:
+            steps: Number of actions to undo.
+        
+        Returns:
+            Number of actions actually undone.
+        
+        Raises:
+            ValueError: If steps is negative.
+        """
+        if steps < 0:
+            raise ValueError("steps must not be negative.")
+        kinds, args = self.history.pop(steps)
+        for kind, arg in zip(kinds.tolist(), args.tolist()):
+            if kind == _ACTION_ADD:
+                self._remove(arg)
+            self._release(self.redo_stack.push(kind, arg))
+        return len(kinds)
+    
+    def redo(self, steps: int = 1) -> int:
+        """Redo the most recently undone actions.
+        
+        Args:
+            steps: Number of actions to redo.
+        
+        Returns:
+            Number of actions actually redone.
+        
+        Raises:
+            ValueError: If steps is negative.
+        """
+        if steps < 0:
+            raise ValueError("steps must not be negative.")
+        kinds, args = self.redo_stack.pop(steps)
+        for kind, arg in zip(kinds.tolist(), args.tolist()):
+            if kind == _ACTION_ADD:
+                self._insert(self._registry[arg])
+            self._release(self.history.push(kind, arg))
+        return len(kinds)
+    
+    def _register(self, part: Part) -> int:
+        """Store a part being added in a free registry slot.
         
+        Returns:
+            Index of the part in the registry.
+        """
+        position = len(self.parts)
+        if self._free_entries:
+            entry = self._free_entries.pop()
+            self._registry[entry] = part
+            self._positions[entry] = position
+            return entry
+        self._registry.append(part)
+        self._positions.append(position)
+        return len(self._registry) - 1
+    
+    def _release(self, entry: Optional[int]) -> None:
+        """Free the registry slot of an action that left the history.
+        
+        Args:
+            entry: Index in the registry, or None if no action was dropped.
+        """
+        if entry is not None:
+            self._registry[entry] = None
+            self._free_entries.append(entry)
+    
+    def _insert(self, part: Part) -> None:
+        """Append a part and index it by name."""
+        self.parts.append(part)
+        self._by_name.setdefault(part.name, part)
+    
+    def _remove(self, entry: int) -> None:
+        """Remove a registered part and drop it from the name index.
+        
+        Undo runs in reverse order of the additions, so the part is still at
+        the position it was added at (the end of the list) and is deleted by
+        index instead of searching the list for it.
+        
+        Args:
+            entry: Index of the part in the registry.
+        """
+        part = self._registry[entry]
+        position = self._positions[entry]
+        if position < len(self.parts) and self.parts[position] is part:
+            del self.parts[position]
+        elif part in self.parts:
+            self.parts.remove(part)
+        if self._by_name.get(part.name) is part:
+            del self._by_name[part.name]
+            fallback = next((p for p in self.parts if p.name == part.name), None)
+            if fallback is not None:
+                self._by_name[part.name] = fallback
+    
+    def get_part(self, name: str) -> Optional[Part]:
+        """Look up a part by name.
+        
+        Args:
+            name: Name of the part.
+        
+        Returns:
+            The first part added with that name, or None if there is none.
+        """
+        return self._by_name.get(name)
+    
+    def _rebuild_index(self) -> None:
+        """Rebuild the name index after the parts list was replaced."""
+        self._by_name = {}
+        for part in self.parts:
+            self._by_name.setdefault(part.name, part)
+    
+    def translate_all(self, x: float, y: float, z: float) -> None:
+        """Translate every part in the document.
+        
+        Args:
+            x: Translation along the X-axis.
+            y: Translation along the Y-axis.
+            z: Translation along the Z-axis.
+        """
+        self.transform_all(None, (x, y, z))
+    
+    def transform_all(self, rotation: Optional[np.ndarray], translation: np.ndarray) -> None:
+        """Apply the same rigid transform to every part in the document.
+        
+        The rotation and translation are combined into one 4x4 matrix that
+        each part records like Part.with_transform, so no mesh is touched
+        until it is needed and primitives keep their intrinsic parameters.
+        
+        Args:
+            rotation: 3x3 rotation matrix, or None for a pure translation.
+            translation: Translation vector (x, y, z).
+        
+        Raises:
+            ValueError: If the rotation is not a proper rotation matrix.
+        """
+        matrix = np.eye(4)
+        if rotation is not None:
+            matrix[:3, :3] = rotation
+        matrix[:3, 3] = translation
+        if not _is_rigid(matrix):
+            raise ValueError("Rotation must be a proper 3x3 rotation matrix")
+        
+        transformed = {id(part): part.with_transform(matrix) for part in self.parts}
+        self.parts = [transformed[id(part)] for part in self.parts]
+        # Point history entries at the transformed parts so undo removes them
+        self._registry = [transformed.get(id(part), part) for part in self._registry]
+        self._rebuild_index()
+    
+    @property
+    def geometry(self) -> Tuple[Entity, ...]:
+        """Geometry added with add_geometry, in order, as a read-only tuple."""
+        return tuple(self._geometry)
+    
     def add_geometry(self, geom: Entity) -> None:
-        self.geometry.append(geom)
+        """Add a geometric entity to the document.
+        
+        Point sets are copied into the document's vertex and face buffers.
+        
+        Args:
+            geom: The entity to add.
+        """
+        self._geometry.append(geom)
+        if isinstance(geom, Points):
+            start = len(self._vertices)
+            self._vertices.extend(geom.positions)
+            self._faces.extend(geom.triangle_indices() + np.int64(start))
         
     def get_mesh_data(self) -> Tuple[np.ndarray, np.ndarray]:
-        vertices = []
-        faces = []
-        
-        for geom in self.geometry:
-            if isinstance(geom, Points):
-                vert_start = len(vertices)
-                for point in geom.positions:
-                    vertices.append(point)
-                
-                if len(vertices) >= 3:
-                    for i in range(len(vertices) - 2):
-                        faces.append([vert_start, vert_start + i + 1, vert_start + i + 2])
-        
-        return np.array(vertices), np.array(faces)
+        """Return the vertices and fan triangulated faces of all point sets.
+        
+        Point sets are copied into contiguous vertex and face buffers when
+        they are added, so this only slices those buffers.
+        
+        Returns:
+            Tuple of float32 vertices (N, 3) and int64 faces (M, 3), as
+            read-only views of the document's buffers. Each point set with at
+            least three points is fanned from its own first vertex.
+        """
+        vertices, faces = self._vertices.view(), self._faces.view()
+        vertices.flags.writeable = False
+        faces.flags.writeable = False
+        return vertices, faces
 
 def create_document_from_geometry(geometry_list: List[Entity]) -> Document:
     doc = Document()
@@ -1,8 +1,39 @@
+from __future__ import annotations
+
+import os
+import struct
+import tempfile
 import numpy as np
-from typing import List, Tuple
+from typing import List, Optional
+from ..core.geometry.base import _ensure_tri, _is_all_tris
 from ..core.geometry.primitives import Points
+from ..core.geometry.types import GeometryError
 from .base import Document
 
+try:
+    import numba
+except ImportError:  # Optional dependency for the parallel STL record kernel
+    numba = None
+
+# Memory-backed temp directory for exporters that can only write to a path
+_TMPFS_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+# Buffer size for files written by the exporters
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Binary STL triangle record: normal, three vertices and attribute byte count
+_STL_RECORD = np.dtype([
+    ('normal', '<f4', (3,)),
+    ('vertices', '<f4', (3, 3)),
+    ('attr', '<u2'),
+])
+
+# Little-endian triangle count following the 80-byte STL header
+_STL_COUNT = struct.Struct('<I')
+
+# Meshes with at least this many triangles use the Numba kernel, if installed
+_NUMBA_MIN_TRIANGLES = 100_000
+
 def create_document_from_geometry(points: List['Entity']) -> Document:
     doc = Document()
     positions = [p.position for p in points]
@@ -15,26 +46,275 @@ def export_stl(doc: Document, filepath: str) -> bool:
         print("Warning: No mesh data to write!")
         return False
         
-    normals = []
-    for face in faces:
-        v1, v2, v3 = vertices[face]
-        normal = np.cross(v2 - v1, v3 - v1)
-        norm = np.linalg.norm(normal)
-        if norm > 0:
-            normal = normal / norm
-        normals.append(normal)
+    records = _stl_records(vertices, faces)
     
     try:
-        with open(filepath, 'wb') as f:
-            f.write(b'\0' * 80)
-            f.write(len(faces).to_bytes(4, 'little'))
-            
-            for normal, face in zip(normals, faces):
-                f.write(normal.astype(np.float32).tobytes())
-                for idx in face:
-                    f.write(vertices[idx].astype(np.float32).tobytes())
-                f.write(b'\0\0')
+        with open(filepath, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+            f.write(_stl_header(len(records)))
+            f.write(records)
         return True
     except Exception as e:
         print(f"Error writing STL file: {e}")
-        return False
\ No newline at end of file
+        return False
+
+def export_document(document: Document, format: str) -> bytes:
+    """Export all parts of a document.
+    
+    Args:
+        document: The Document instance to export.
+        format: Target file format, "STL" or "STEP" (case-insensitive).
+    
+    Returns:
+        The exported file content.
+    
+    Raises:
+        ValueError: If the format is not supported.
+    """
+    exporters = {"STL": _export_stl, "STEP": _export_step}
+    exporter = exporters.get(format.upper())
+    if exporter is None:
+        raise ValueError(f"Unsupported export format: {format}")
+    return exporter(document)
+
+def _export_stl(document: Document) -> bytes:
+    """Export the document parts as a binary STL file.
+    
+    The file is packed in memory straight from the mesh arrays, without a
+    temporary file or the VTK writer pipeline. Records are written into
+    one preallocated buffer, a slice per part, so the parts are never
+    concatenated into a combined mesh first.
+    """
+    arrays = [part.geometry._arrays() for part in document.parts]
+    total = sum(len(triangles) for _, triangles in arrays)
+    
+    buffer = bytearray(84 + _STL_RECORD.itemsize * total)
+    _STL_COUNT.pack_into(buffer, 80, total)
+    records = np.frombuffer(buffer, dtype=_STL_RECORD, offset=84)
+    
+    start = 0
+    for points, triangles in arrays:
+        end = start + len(triangles)
+        _stl_records(points, triangles, out=records[start:end])
+        start = end
+    return bytes(buffer)
+
+def _stl_header(count: int) -> bytearray:
+    """Build the 84-byte binary STL header: 80 zero bytes and the triangle count."""
+    header = bytearray(84)
+    _STL_COUNT.pack_into(header, 80, count)
+    return header
+
+def _stl_records(points: np.ndarray, triangles: np.ndarray,
+                 out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Build binary STL records for a triangle mesh.
+    
+    Args:
+        points: (N, 3) vertex positions.
+        triangles: (F, 3) vertex indices per triangle.
+        out: Optional structured array of F records to fill in place.
+    
+    Returns:
+        Structured array of F records, ready to be written with tobytes().
+    """
+    records = np.zeros(len(triangles), dtype=_STL_RECORD) if out is None else out
+    if _fill_stl_records is not None and len(triangles) >= _NUMBA_MIN_TRIANGLES:
+        _fill_stl_records(points, triangles, records)
+        return records
+    
+    # Gather the corners once, straight into the records, and derive the
+    # normals from those instead of gathering each corner separately
+    corners = records['vertices']
+    corners[...] = points[triangles]
+    edges = corners[:, 1:] - corners[:, :1]
+    normals = np.cross(edges[:, 0], edges[:, 1])
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    normals /= np.maximum(lengths, np.finfo(normals.dtype).tiny, out=lengths)
+    records['normal'] = normals
+    records['attr'] = 0
+    return records
+
+if numba is not None:
+    @numba.njit(parallel=True, cache=True)
+    def _fill_stl_records(points, triangles, records):
+        """Fill STL records in one parallel pass over the triangles.
+        
+        Each triangle's corners are loaded once and its normal is computed
+        from scalars, without the temporaries of the NumPy path. The output
+        is identical to the NumPy path, so fastmath is not used.
+        """
+        for t in numba.prange(len(triangles)):
+            record = records[t]
+            a, b, c = triangles[t, 0], triangles[t, 1], triangles[t, 2]
+            for k in range(3):
+                record.vertices[0, k] = points[a, k]
+                record.vertices[1, k] = points[b, k]
+                record.vertices[2, k] = points[c, k]
+            ux = points[b, 0] - points[a, 0]
+            uy = points[b, 1] - points[a, 1]
+            uz = points[b, 2] - points[a, 2]
+            vx = points[c, 0] - points[a, 0]
+            vy = points[c, 1] - points[a, 1]
+            vz = points[c, 2] - points[a, 2]
+            nx = uy * vz - uz * vy
+            ny = uz * vx - ux * vz
+            nz = ux * vy - uy * vx
+            length = np.sqrt(nx * nx + ny * ny + nz * nz)
+            if length > 0:
+                nx, ny, nz = nx / length, ny / length, nz / length
+            record.normal[0] = nx
+            record.normal[1] = ny
+            record.normal[2] = nz
+            record.attr = 0
+else:
+    _fill_stl_records = None
+
+def _export_step(document: Document) -> bytes:
+    """Export the document parts as a STEP file using OpenCASCADE."""
+    from OCC.Core.IFSelect import IFSelect_RetDone
+    from OCC.Core.STEPControl import STEPControl_AsIs, STEPControl_Writer
+    
+    writer = STEPControl_Writer()
+    to_shape = _mesh_to_occ_triangulation if _occ_writes_tessellation() else _mesh_to_occ_shape
+    for part in document.parts:
+        mesh = _ensure_tri(part.geometry)
+        writer.Transfer(to_shape(mesh), STEPControl_AsIs)
+    
+    # The writer only accepts a path; keep the descriptor from mkstemp open
+    # and read the result back through it instead of reopening the file
+    fd, path = tempfile.mkstemp(suffix=".step", dir=_TMPFS_DIR)
+    try:
+        if writer.Write(path) != IFSelect_RetDone:
+            raise OSError("Failed to write STEP file")
+        return _read_fd(fd)
+    finally:
+        os.close(fd)
+        os.remove(path)
+
+def _read_fd(fd: int) -> bytes:
+    """Read a whole file from an open descriptor, sized with fstat.
+    
+    Args:
+        fd: Descriptor positioned at the start of the file.
+    
+    Returns:
+        The file contents.
+    """
+    size = os.fstat(fd).st_size
+    chunks = []
+    while size > 0:
+        chunk = os.read(fd, size)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+def _triangle_indices(mesh) -> np.ndarray:
+    """Return the (T, 3) vertex indices of a triangle-only PyVista mesh.
+    
+    Raises:
+        GeometryError: If the mesh has cells that are not triangles.
+    """
+    if not _is_all_tris(mesh):
+        raise GeometryError("Mesh must be triangulated before export")
+    return mesh.faces.reshape(-1, 4)[:, 1:].astype(np.int32, copy=False)
+
+def _occ_writes_tessellation() -> bool:
+    """Whether the STEP writer can export faces that only carry a triangulation.
+    
+    OpenCASCADE 7.7 added tessellated geometry to the STEP writer; older
+    versions need a planar B-rep face per triangle.
+    """
+    import OCC
+    
+    try:
+        major, minor = (int(part) for part in OCC.VERSION.split(".")[:2])
+    except (AttributeError, ValueError):
+        return False
+    return (major, minor) >= (7, 7)
+
+def _mesh_to_occ_triangulation(mesh) -> "TopoDS_Face":
+    """Convert a triangulated PyVista mesh into a single triangulated face.
+    
+    The mesh goes into one Poly_Triangulation, so the only per-element work
+    is filling its node and triangle arrays, with no B-rep vertices, edges,
+    wires or faces built per triangle.
+    
+    Args:
+        mesh: Triangulated PyVista PolyData.
+    
+    Returns:
+        OpenCASCADE face without a surface, holding the mesh triangulation.
+    """
+    from OCC.Core.BRep import BRep_Builder
+    from OCC.Core.Poly import Poly_Array1OfTriangle, Poly_Triangle, Poly_Triangulation
+    from OCC.Core.TColgp import TColgp_Array1OfPnt
+    from OCC.Core.TopoDS import TopoDS_Face
+    from OCC.Core.gp import gp_Pnt
+    
+    points = mesh.points.tolist()
+    nodes = TColgp_Array1OfPnt(1, len(points))
+    for i, (x, y, z) in enumerate(points, 1):
+        nodes.SetValue(i, gp_Pnt(x, y, z))
+    
+    # OCC node indices are 1-based
+    triangles = (_triangle_indices(mesh) + 1).tolist()
+    polys = Poly_Array1OfTriangle(1, len(triangles))
+    for i, (a, b, c) in enumerate(triangles, 1):
+        polys.SetValue(i, Poly_Triangle(a, b, c))
+    
+    # MakeFace with a triangulation builds the face and attaches the
+    # triangulation, as UpdateFace does for an existing face
+    face = TopoDS_Face()
+    BRep_Builder().MakeFace(face, Poly_Triangulation(nodes, polys))
+    return face
+
+def _mesh_to_occ_shape(mesh) -> "TopoDS_Compound":
+    """Convert a triangulated PyVista mesh into a compound of planar faces.
+    
+    Vertices and edges are built once and shared between adjacent
+    triangles instead of being recreated for every face.
+    
+    Args:
+        mesh: Triangulated PyVista PolyData.
+    
+    Returns:
+        OpenCASCADE compound holding one face per triangle.
+    """
+    from OCC.Core.BRep import BRep_Builder
+    from OCC.Core.BRepBuilderAPI import (BRepBuilderAPI_MakeEdge, BRepBuilderAPI_MakeFace,
+                                         BRepBuilderAPI_MakeVertex, BRepBuilderAPI_MakeWire)
+    from OCC.Core.TopoDS import TopoDS_Compound
+    from OCC.Core.gp import gp_Pnt
+    
+    vertices = [BRepBuilderAPI_MakeVertex(gp_Pnt(x, y, z)).Vertex()
+                for x, y, z in mesh.points.tolist()]
+    
+    triangles = _triangle_indices(mesh)
+    
+    # Find the unique undirected edges and, for every triangle, the indices
+    # of its three edges in a single NumPy pass instead of a per-triangle
+    # dictionary lookup
+    pairs = np.sort(triangles[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2), axis=1)
+    unique_pairs, edge_ids = np.unique(pairs, axis=0, return_inverse=True)
+    edges = []
+    for i, j in unique_pairs.tolist():
+        maker = BRepBuilderAPI_MakeEdge(vertices[i], vertices[j])
+        edges.append(maker.Edge() if maker.IsDone() else None)
+    
+    compound = TopoDS_Compound()
+    builder = BRep_Builder()
+    builder.MakeCompound(compound)
+    add_to_compound = builder.Add
+    
+    for e0, e1, e2 in edge_ids.reshape(-1, 3).tolist():
+        edge0, edge1, edge2 = edges[e0], edges[e1], edges[e2]
+        if edge0 is None or edge1 is None or edge2 is None:
+            continue  # Degenerate triangle
+        wire = BRepBuilderAPI_MakeWire(edge0, edge1, edge2)
+        if not wire.IsDone():
+            continue
+        face = BRepBuilderAPI_MakeFace(wire.Wire(), True)
+        if face.IsDone():
+            add_to_compound(compound, face.Face())
+    return compound
@@ -1,9 +1,12 @@
 """Document visualization functionality using PyVista."""
 
-import pyvista as pv
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
 from .base import Document
+from ..part.base import Part
 
-def visualize_document(document: Document) -> None:
+def visualize_document(document: Document, plotter_cls: Optional[Callable] = None) -> None:
     """Visualize the parts in a document using PyVista.
     
     Creates a 3D visualization window showing all parts in the document
@@ -12,22 +15,33 @@ def visualize_document(document: Document) -> None:
     
     Args:
         document: The Document instance to visualize.
+        plotter_cls: Factory for the plotter, pyvista.Plotter by default.
         
     Note:
         This is a blocking operation - code execution will pause until
         the visualization window is closed.
     """
+    if plotter_cls is None:
+        # Imported here so that loading the package does not pull in VTK
+        import pyvista as pv
+        plotter_cls = pv.Plotter
+    
     try:
         # Create a plotter instance
-        plotter = pv.Plotter()
+        plotter = plotter_cls()
         
         # Color map for different parts
         colors = ['red', 'blue', 'green', 'yellow', 'cyan', 'magenta']
         
+        # Mesh the parts up front, concurrently; the plotter itself is only
+        # used from this thread since VTK rendering is not thread-safe
+        meshes = _part_meshes(document.parts)
+        
         for i, part in enumerate(document.parts):
             try:
-                # Convert the part's geometry to a PyVista mesh
-                mesh = part.geometry.to_pyvista()
+                mesh = meshes[_geometry_key(part)]
+                if isinstance(mesh, Exception):
+                    raise mesh
                 # Add mesh to plotter with a unique color
                 plotter.add_mesh(mesh, color=colors[i % len(colors)],
                                label=f"{part.name or f'Part {i+1}'}")
@@ -42,3 +56,40 @@ def visualize_document(document: Document) -> None:
         
     except Exception as e:
         print(f"Error during visualization: {str(e)}")
+
+def _geometry_key(part: Part) -> int:
+    """Identify the geometry data a part's mesh is built from."""
+    geometry = part.geometry
+    return id(geometry._data if geometry._data is not None else geometry)
+
+def _part_meshes(parts: List[Part]) -> Dict[int, object]:
+    """Convert the geometries of parts to PyVista meshes.
+    
+    Parts listed more than once, or sharing a geometry, are meshed once:
+    building a mesh writes to the geometry data without a lock, so each
+    GeometryData is only ever handled by one thread. The distinct
+    geometries are meshed on a thread pool, since building and transforming
+    meshes runs mostly in NumPy and VTK, which release the GIL.
+    
+    Args:
+        parts: Parts to mesh.
+    
+    Returns:
+        Mesh per _geometry_key of the parts, or the exception raised while
+        building it.
+    """
+    geometries = {_geometry_key(part): part.geometry for part in parts}
+    
+    def mesh(geometry):
+        try:
+            return geometry.to_pyvista()
+        except Exception as e:
+            return e
+    
+    workers = min(len(geometries), os.cpu_count() or 1)
+    if len(parts) < 2 or workers < 2:
+        meshes = [mesh(geometry) for geometry in geometries.values()]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            meshes = list(executor.map(mesh, geometries.values()))
+    return dict(zip(geometries, meshes))
@@ -1,16 +1,47 @@
 """Base implementation of CAD parts."""
 
 from typing import Dict, Any, Optional
+import numpy as np
 from ..core.geometry.base import Geometry
 from ..core.geometry.primitives import Box, Cylinder
 
 class Part:
     """Represents a single CAD part and its associated geometry."""
     
+    __slots__ = ("name", "geometry", "_parameters", "_parameters_shared")
+    
     def __init__(self, name: str, geometry: Geometry, parameters: Optional[Dict[str, Any]] = None) -> None:
         self.name: str = name
         self.geometry: Geometry = geometry
-        self.parameters: Dict[str, Any] = parameters if parameters is not None else {}
+        self._parameters: Dict[str, Any] = parameters if parameters is not None else {}
+        # Whether the dict is shared with parts made by translate/rotate/clone
+        self._parameters_shared: bool = False
+    
+    @property
+    def parameters(self) -> Dict[str, Any]:
+        """Parameters of the part, as a plain dict.
+        
+        Parts made by translate, rotate, with_transform and clone share the
+        dict of their source instead of copying it. Once shared, each side
+        takes a private copy the first time its parameters are accessed, so
+        a dict passed to the constructor stops being the part's parameters
+        after the part has been transformed or cloned.
+        """
+        if self._parameters_shared:
+            self._parameters = dict(self._parameters)
+            self._parameters_shared = False
+        return self._parameters
+    
+    @parameters.setter
+    def parameters(self, parameters: Dict[str, Any]) -> None:
+        self._parameters = parameters
+        self._parameters_shared = False
+    
+    def _derive(self, geometry: Geometry) -> "Part":
+        """Create a part with new geometry, sharing the parameters of this one."""
+        part = Part(self.name, geometry, self._parameters)
+        part._parameters_shared = self._parameters_shared = True
+        return part
     
     @staticmethod
     def box(width: float, height: float, depth: float) -> "Part":
@@ -53,7 +84,7 @@ class Part:
             A new translated Part instance.
         """
         new_geometry = self.geometry.translate(x, y, z)
-        return Part(self.name, new_geometry, self.parameters.copy())
+        return self._derive(new_geometry)
     
     def rotate(self, angle: float, axis: tuple[float, float, float]) -> "Part":
         """Rotate the part, returning a new Part instance.
@@ -66,7 +97,25 @@ class Part:
             A new rotated Part instance.
         """
         new_geometry = self.geometry.rotate(angle, axis)
-        return Part(self.name, new_geometry, self.parameters.copy())
+        return self._derive(new_geometry)
+    
+    def with_transform(self, matrix: np.ndarray) -> "Part":
+        """Apply a rigid 4x4 transformation matrix, returning a new Part instance.
+        
+        Like translate and rotate, this copies neither the mesh nor the
+        parameters: the new part's geometry records the transform and
+        applies it when its mesh is first needed.
+        
+        Args:
+            matrix: 4x4 rigid transformation matrix acting on (x, y, z, 1).
+        
+        Returns:
+            A new transformed Part instance.
+        
+        Raises:
+            ValueError: If the matrix is not a 4x4 rigid transform.
+        """
+        return self._derive(self.geometry.transform(matrix))
     
     def clone(self) -> "Part":
         """Return a deep copy of the part.
@@ -74,7 +123,7 @@ class Part:
         Returns:
             A new cloned Part instance.
         """
-        return Part(self.name, self.geometry.clone(), self.parameters.copy())
+        return self._derive(self.geometry.clone())
     
     def parameterize(self) -> "ParametricPart":
         """Convert this part into a parametric model.
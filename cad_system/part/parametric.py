@@ -1,8 +1,42 @@
 """Parametric part implementation with constraint support."""
 
 from typing import List, Tuple, Dict
+import numpy as np
 from .base import Part
 
+# Constraint count above which "equal" groups are found with array operations
+_VECTORIZE_THRESHOLD = 1024
+
+def _equal_group_labels(first: np.ndarray, second: np.ndarray, count: int) -> np.ndarray:
+    """Label the connected groups of parameters linked by equality.
+    
+    Each round hooks every group onto the smallest label among its links
+    and then shortcuts label chains, so the loop runs a few NumPy passes
+    over all links instead of one Python step per link.
+    
+    Args:
+        first: Index of the first parameter of each link.
+        second: Index of the second parameter of each link.
+        count: Number of parameters.
+    
+    Returns:
+        For each parameter, the smallest parameter index in its group.
+    """
+    labels = np.arange(count)
+    while True:
+        low = np.minimum(labels[first], labels[second])
+        hooked = labels.copy()
+        np.minimum.at(hooked, labels[first], low)
+        np.minimum.at(hooked, labels[second], low)
+        while True:
+            jumped = hooked[hooked]
+            if np.array_equal(jumped, hooked):
+                break
+            hooked = jumped
+        if np.array_equal(hooked, labels):
+            return labels
+        labels = hooked
+
 class ParametricPart:
     """Represents a parametric version of a part for constraint-based modifications."""
     
@@ -14,6 +48,9 @@ class ParametricPart:
         """
         self.part: Part = part
         self.constraints: List[Tuple[str, str, str]] = []  # Each constraint: (parameter1, parameter2, relation)
+        # "equal" constraints as index pairs into the interned parameter names
+        self._equal_names: Dict[str, int] = {}
+        self._equal_pairs: List[Tuple[int, int]] = []
     
     def add_constraint(self, param1: str, param2: str, relation: str) -> None:
         """Add a constraint between two parameters.
@@ -24,6 +61,11 @@ class ParametricPart:
             relation: A string denoting the relationship (e.g., "equal").
         """
         self.constraints.append((param1, param2, relation))
+        if relation == "equal":
+            names = self._equal_names
+            index1 = names.setdefault(param1, len(names))
+            index2 = names.setdefault(param2, len(names))
+            self._equal_pairs.append((index1, index2))
     
     def update_parameters(self, params: Dict[str, float]) -> None:
         """Update parameters of the underlying part.
@@ -36,17 +78,69 @@ class ParametricPart:
     def solve(self) -> bool:
         """Solve the parametric constraints.
         
-        Note:
-            This is a stub implementation. A complete solver would adjust parameters
-            according to constraints.
+        Parameters linked by "equal" constraints are grouped with a union-find,
+        so chains such as (a, b) and (b, c) resolve in a single pass. Each group
+        takes the value of its first defined parameter, in the order the
+        parameters appear in the constraints.
         
         Returns:
             True if successful, False otherwise.
         """
+        if len(self._equal_pairs) > _VECTORIZE_THRESHOLD:
+            return self._solve_vectorized()
+        
+        parent: Dict[str, str] = {}
+        
+        def find(name: str) -> str:
+            parent.setdefault(name, name)
+            while parent[name] != name:
+                parent[name] = parent[parent[name]]  # Path halving
+                name = parent[name]
+            return name
+        
         for (p1, p2, relation) in self.constraints:
             if relation == "equal":
-                if p1 in self.part.parameters:
-                    self.part.parameters[p2] = self.part.parameters[p1]
-                elif p2 in self.part.parameters:
-                    self.part.parameters[p1] = self.part.parameters[p2]
+                root1, root2 = find(p1), find(p2)
+                if root1 != root2:
+                    parent[root2] = root1
+        
+        groups: Dict[str, List[str]] = {}
+        for name in list(parent):
+            groups.setdefault(find(name), []).append(name)
+        
+        parameters = self.part.parameters
+        for members in groups.values():
+            source = next((name for name in members if name in parameters), None)
+            if source is not None:
+                parameters.update(dict.fromkeys(members, parameters[source]))
+        return True
+    
+    def _solve_vectorized(self) -> bool:
+        """Solve "equal" constraints with array operations.
+        
+        Gives the same result as the union-find in solve() for large
+        constraint systems, where per-constraint Python steps dominate.
+        
+        Returns:
+            True if successful, False otherwise.
+        """
+        names = list(self._equal_names)
+        pairs = np.array(self._equal_pairs, dtype=np.intp).reshape(-1, 2)
+        labels = _equal_group_labels(pairs[:, 0], pairs[:, 1], len(names))
+        
+        parameters = self.part.parameters
+        defined = np.flatnonzero([name in parameters for name in names])
+        if len(defined) == 0:
+            return True
+        # Names are interned in order of appearance, so the first defined
+        # member of a group is the first occurrence of its label
+        group_labels, first = np.unique(labels[defined], return_index=True)
+        source = np.full(len(names), -1)
+        source[group_labels] = defined[first]
+        
+        member_sources = source[labels].tolist()
+        parameters.update({
+            name: parameters[names[index]]
+            for name, index in zip(names, member_sources) if index >= 0
+        })
         return True
@@ -1,9 +1,15 @@
 """Main CAD system interface."""
 
 import json
-from typing import Dict, Any, Optional
+import os
+from typing import IO, Dict, Any, Optional, Union
 from .document.base import Document
 
+try:
+    import orjson
+except ImportError:  # Optional dependency for fast JSON parsing
+    orjson = None
+
 class CADSystem:
     """The main CAD system interface for creating and managing documents."""
     
@@ -11,7 +17,8 @@ class CADSystem:
         """Initialize the CAD system.
         
         Args:
-            config: Optional configuration dictionary.
+            config: Optional configuration dictionary. "max_history" bounds
+                the number of undoable actions kept per document.
         """
         self.config: Dict[str, Any] = config if config is not None else {}
         self.version: str = "1.0.0"
@@ -30,13 +37,14 @@ class CADSystem:
         """
         if not name:
             raise ValueError("Document name must not be empty.")
-        return Document(name)
+        return Document(name, max_history=self.config.get("max_history"))
     
-    def load_document(self, path: str) -> Document:
-        """Load a document from disk by reading a JSON file.
+    def load_document(self, source: Union[str, os.PathLike, IO]) -> Document:
+        """Load a document from a JSON file.
         
         Args:
-            path: The file path from which to load the document.
+            source: The file path from which to load the document, or an
+                open binary or text file object to read it from.
         
         Returns:
             The loaded Document instance.
@@ -45,8 +53,17 @@ class CADSystem:
             FileNotFoundError: If the file does not exist.
             json.JSONDecodeError: If the file content is not valid JSON.
         """
-        with open(path, "r") as f:
-            data = json.load(f)
+        if hasattr(source, "read"):
+            raw = source.read()
+        else:
+            with open(source, "rb") as f:
+                raw = f.read()
+        if orjson is not None:
+            # orjson parses the raw bytes without a separate decode pass; its
+            # JSONDecodeError is a subclass of json.JSONDecodeError
+            data = orjson.loads(raw)
+        else:
+            data = json.loads(raw)
         doc = Document(data["name"])
         # TODO: Deserialize parts, history, and redo_stack if needed.
         return doc
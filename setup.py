@@ -26,6 +26,15 @@ setup(
         "matplotlib>=3.4.0",
     ],
     extras_require={
+        "manifold": [
+            "manifold3d>=2.3",
+        ],
+        "json": [
+            "orjson>=3.0",
+        ],
+        "numba": [
+            "numba>=0.56",
+        ],
         "dev": [
             "pytest>=6.0",
             "pytest-cov>=2.0",
@@ -4,19 +4,24 @@ Tests are organized by package structure to match the modular organization.
 """
 
 import unittest
+import importlib.util
+import io
 import os
 import json
 import tempfile
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 import numpy as np
 import pyvista as pv
 
 from cad_system.core.geometry.base import Geometry
-from cad_system.core.geometry.primitives import Box, Cylinder
-from cad_system.core.operations.boolean import difference, union, intersection
-from cad_system.core.operations.transforms import transform_part, translate_part, rotate_part
+from cad_system.core.geometry.primitives import Box, Cylinder, Points
+from cad_system.core.operations._backends import _apply_env_backend
+from cad_system.core.operations.boolean import (difference, union, intersection, nary_difference,
+                                                batch_boolean, get_backend, set_backend)
+from cad_system.core.operations.transforms import (transform_part, translate_part, rotate_part,
+                                                   matrix_transform_part)
 from cad_system.document.base import Document
-from cad_system.document.io import export_document
+from cad_system.document.io import export_document, export_stl
 from cad_system.document.visualization import visualize_document
 from cad_system.part.base import Part
 from cad_system.part.parametric import ParametricPart
@@ -32,6 +37,15 @@ class TestGeometry(unittest.TestCase):
             
         with self.assertRaises(ValueError):
             Cylinder(-5, 10)  # Negative radius
+    
+    def test_from_pyvista_keeps_input(self):
+        """Test that converting a float64 mesh leaves its points unchanged."""
+        mesh = pv.Cube()
+        mesh.points = mesh.points.astype(np.float64)
+        for cls in (Geometry, Box, Cylinder):
+            geometry = cls.from_pyvista(mesh)
+            self.assertEqual(mesh.points.dtype, np.float64)
+            self.assertEqual(geometry.to_pyvista().points.dtype, np.float32)
 
 class TestBox(unittest.TestCase):
     def test_box_creation(self):
@@ -52,6 +66,12 @@ class TestBox(unittest.TestCase):
         self.assertAlmostEqual(bounds[1] - bounds[0], 10)  # width
         self.assertAlmostEqual(bounds[3] - bounds[2], 20)  # height
         self.assertAlmostEqual(bounds[5] - bounds[4], 30)  # depth
+    
+    def test_box_bounds(self):
+        """Test that analytic bounds match the transformed mesh."""
+        box = Box(10, 20, 30).rotate(30, (1, 1, 0)).translate(5, 0, 0)
+        self.assertIsNone(box.data.mesh)  # Bounds must not build the mesh
+        np.testing.assert_allclose(box.bounds, box.to_pyvista().bounds, atol=1e-4)
 
 class TestCylinder(unittest.TestCase):
     def test_cylinder_creation(self):
@@ -71,6 +91,12 @@ class TestCylinder(unittest.TestCase):
         self.assertAlmostEqual(bounds[1] - bounds[0], 10)  # diameter
         self.assertAlmostEqual(bounds[3] - bounds[2], 10)  # diameter
         self.assertAlmostEqual(bounds[5] - bounds[4], 15)  # height
+    
+    def test_cylinder_volume(self):
+        """Test that the analytic volume matches the mesh volume."""
+        cylinder = Cylinder(5, 15).rotate(30, (1, 0, 0))
+        self.assertAlmostEqual(cylinder.volume, cylinder.to_pyvista().volume, places=2)
+        self.assertEqual(Box(20, 30, 10).volume, 6000)
 
 # Operations Tests
 class TestTransforms(unittest.TestCase):
@@ -88,6 +114,27 @@ class TestTransforms(unittest.TestCase):
         # Test rotation
         rotated = rotate_part(part, 90, (0, 0, 1))
         self.assertIsInstance(rotated.geometry.to_pyvista(), pv.PolyData)
+    
+    def test_matrix_transform(self):
+        """Test that a 4x4 matrix matches chained rotate and translate."""
+        part = Part("TestBox", Box(10, 20, 30))
+        chained = translate_part(rotate_part(part, 90, (0, 0, 1)), 5, 0, 0)
+        
+        matrix = np.array([[0, -1, 0, 5], [1, 0, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]])
+        fused = matrix_transform_part(part, matrix)
+        np.testing.assert_allclose(fused.geometry.to_pyvista().points,
+                                   chained.geometry.to_pyvista().points, atol=1e-5)
+        
+        with self.assertRaises(ValueError):
+            matrix_transform_part(part, np.diag([2, 2, 2, 1]))
+        
+        mesh = part.geometry.to_pyvista()
+        moved = part.with_transform(np.eye(4))
+        self.assertIsNot(moved, part)
+        self.assertIs(moved.geometry.data.mesh, mesh)  # Shared until transformed
+        self.assertIsNone(moved.geometry.data.pending_transform)
+        self.assertIsNone(part.translate(1, 0, 0).translate(-1, 0, 0).geometry.data.pending_transform)
+        self.assertIsNot(part.clone().geometry.to_pyvista(), mesh)
 
 class TestBooleanOperations(unittest.TestCase):
     def test_boolean_operations(self):
@@ -123,6 +170,134 @@ class TestBooleanOperations(unittest.TestCase):
                           base.geometry.to_pyvista().volume)
         except BooleanOperationError as e:
             self.fail(f"Boolean intersection failed: {str(e)}")
+    
+    def test_nary_difference(self):
+        """Test subtracting several parts in one operation."""
+        base = Part("Base", Box(20, 30, 10))
+        holes = [translate_part(Part("Hole", Cylinder(3, 12)), x, 0, 0) for x in (-5, 5)]
+        
+        result = nary_difference(base, holes)
+        self.assertEqual(result.name, "Base_difference_Hole_difference_Hole")
+        single = difference(base, holes[0])
+        self.assertLess(result.geometry.to_pyvista().volume,
+                        single.geometry.to_pyvista().volume)
+    
+    def test_disjoint_parts(self):
+        """Test Boolean operations on parts whose bounding boxes do not meet."""
+        a = Part("A", Box(2, 2, 2))
+        b = translate_part(Part("B", Box(2, 2, 2)), 5, 0, 0)
+        
+        self.assertAlmostEqual(union(a, b).geometry.to_pyvista().volume, 16, places=4)
+        self.assertAlmostEqual(difference(a, b).geometry.to_pyvista().volume, 8, places=4)
+        with self.assertRaises(BooleanOperationError):
+            intersection(a, b)
+    
+    def test_set_backend(self):
+        """Test switching the boolean backend."""
+        self.addCleanup(set_backend, get_backend().name)
+        set_backend("vtk")
+        self.assertEqual(get_backend().name, "vtk")
+        
+        base = Part("Base", Box(20, 30, 10))
+        hole = Part("Hole", Cylinder(5, 12))
+        result = difference(base, hole)
+        self.assertLess(result.geometry.to_pyvista().volume,
+                        base.geometry.to_pyvista().volume)
+        
+        with self.assertRaises(ValueError):
+            set_backend("unknown")
+        
+        try:
+            set_backend("manifold")
+        except GeometryError:
+            pass  # manifold3d not installed
+        else:
+            self.assertEqual(get_backend().name, "manifold3d")
+    
+    def test_env_backend(self):
+        """Test that a bad CAD_BOOL_BACKEND warns and keeps the backend."""
+        backend = get_backend()
+        self.addCleanup(set_backend, backend.name)
+        with patch.dict(os.environ, {"CAD_BOOL_BACKEND": "unknown"}):
+            with self.assertWarns(RuntimeWarning):
+                _apply_env_backend()
+        self.assertIs(get_backend(), backend)
+        
+        with patch.dict(os.environ, {"CAD_BOOL_BACKEND": "vtk"}):
+            _apply_env_backend()
+        self.assertEqual(get_backend().name, "vtk")
+    
+    def test_batch_boolean(self):
+        """Test running independent Boolean operations together."""
+        bases = [translate_part(Part(f"Base{i}", Box(20, 30, 10)), 40 * i, 0, 0) for i in range(3)]
+        holes = [translate_part(Part(f"Hole{i}", Cylinder(5, 12)), 40 * i, 0, 0) for i in range(3)]
+        
+        results = batch_boolean([(base, hole, 'difference') for base, hole in zip(bases, holes)])
+        self.assertEqual([part.name for part in results],
+                         [f"Base{i}_difference_Hole{i}" for i in range(3)])
+        for base, result in zip(bases, results):
+            self.assertLess(result.geometry.to_pyvista().volume,
+                            base.geometry.to_pyvista().volume)
+
+    def test_batch_boolean_shared_inputs(self):
+        """Test concurrent operations that share an unmeshed base part."""
+        base = translate_part(Part("Base", Box(20, 30, 10)), 1, 2, 3)
+        tools = [translate_part(Part("Hole", Cylinder(3, 12)), x + 1, 2, 3) for x in (-6, 0, 6)]
+        expected = [difference(base.clone(), tool).geometry.volume for tool in tools]
+        self.assertIsNotNone(base.geometry.data.pending_transform)
+        
+        operations = [(base, tool, 'difference') for tool in tools + tools]
+        with patch("os.cpu_count", return_value=4):
+            results = batch_boolean(operations)
+        for result, volume in zip(results, expected + expected):
+            self.assertAlmostEqual(result.geometry.volume, volume, places=3)
+        
+        empty = Part("Empty", Geometry())
+        with patch("os.cpu_count", return_value=4):
+            with self.assertRaises(BooleanOperationError):
+                batch_boolean([(base, empty, 'union'), (base, tools[0], 'union')])
+
+# Part Tests
+class TestPart(unittest.TestCase):
+    def test_parameters_copy_on_access(self):
+        """Test that derived parts get independent plain dict parameters."""
+        part = Part.box(1, 2, 3)
+        moved = part.translate(1, 0, 0)
+        moved.parameters["width"] = 5
+        
+        self.assertIsInstance(part.parameters, dict)
+        self.assertEqual(part.parameters, {"width": 1, "height": 2, "depth": 3})
+        self.assertEqual(json.loads(json.dumps(moved.parameters))["width"], 5)
+        
+        part.parameters["depth"] = 7
+        self.assertEqual(part.clone().parameters["depth"], 7)
+        self.assertEqual(moved.parameters["depth"], 3)
+
+class TestParametricPart(unittest.TestCase):
+    def test_solve_equal_constraint_chain(self):
+        """Test that chained equality constraints propagate in one solve."""
+        part = Part("Box", Box(10, 20, 30), {"width": 10, "height": 20, "depth": 30})
+        parametric = ParametricPart(part)
+        parametric.add_constraint("slot_width", "hole_width", "equal")
+        parametric.add_constraint("hole_width", "width", "equal")
+        
+        self.assertTrue(parametric.solve())
+        self.assertEqual(part.parameters["hole_width"], 10)
+        self.assertEqual(part.parameters["slot_width"], 10)
+    
+    def test_solve_large_equal_constraint_chain(self):
+        """Test that large constraint systems give the same groups."""
+        part = Part("Box", Box(10, 20, 30), {"width": 10, "height": 20, "depth": 30})
+        parametric = ParametricPart(part)
+        names = [f"p{i}" for i in range(2000)]
+        for name, next_name in zip(names, names[1:]):
+            parametric.add_constraint(next_name, name, "equal")
+        parametric.add_constraint(names[0], "height", "equal")
+        
+        self.assertTrue(parametric.solve())
+        self.assertEqual(part.parameters["p0"], 20)
+        self.assertEqual(part.parameters["p1999"], 20)
+        self.assertEqual(part.parameters["width"], 10)
 
 # Document Tests
 class TestDocument(unittest.TestCase):
@@ -135,23 +310,166 @@ class TestDocument(unittest.TestCase):
         """Test document creation and initial state."""
         self.assertEqual(self.doc.name, "TestDesign")
         self.assertEqual(len(self.doc.parts), 0)
+    
+    def test_undo_redo(self):
+        """Test undoing and redoing part additions."""
+        box = Part("Box", Box(10, 10, 10))
+        cyl = Part("Cylinder", Cylinder(5, 15))
+        self.doc.add_part(box)
+        self.doc.add_part(cyl)
+        
+        self.assertEqual(self.doc.undo(), 1)
+        self.assertEqual(self.doc.parts, [box])
+        self.assertIsNone(self.doc.get_part("Cylinder"))
+        
+        self.assertEqual(self.doc.undo(5), 1)
+        self.assertEqual(self.doc.parts, [])
+        
+        self.assertEqual(self.doc.redo(2), 2)
+        self.assertEqual(self.doc.parts, [box, cyl])
+        self.assertIs(self.doc.get_part("Cylinder"), cyl)
+        
+        with self.assertRaises(ValueError):
+            self.doc.undo(-1)
+        with self.assertRaises(ValueError):
+            self.doc.redo(-1)
+        self.assertEqual(self.doc.undo(2), 2)
+    
+    def test_undo_after_translate_all(self):
+        """Test that undo removes parts replaced by a document transform."""
+        self.doc.add_part(Part("Box", Box(10, 10, 10)))
+        self.doc.add_part(Part("Cylinder", Cylinder(5, 15)))
+        self.doc.translate_all(1, 2, 3)
+        
+        self.assertEqual(self.doc.undo(), 1)
+        self.assertEqual([part.name for part in self.doc.parts], ["Box"])
+        self.assertEqual(self.doc.redo(), 1)
+        self.assertEqual([part.name for part in self.doc.parts], ["Box", "Cylinder"])
+    
+    def test_transform_all_keeps_primitives(self):
+        """Test that a document transform matches rotating each part."""
+        part = Part.box(10, 20, 30)
+        self.doc.add_part(part)
+        self.doc.transform_all(np.array([[0, -1, 0], [1, 0, 0], [0, 0, 1]]), (5, 0, 0))
+        
+        moved = self.doc.parts[0].geometry
+        expected = part.rotate(90, (0, 0, 1)).translate(5, 0, 0).geometry
+        self.assertEqual((moved.width, moved.height, moved.depth), (10, 20, 30))
+        np.testing.assert_allclose(moved.bounds, expected.bounds, atol=1e-6)
+        np.testing.assert_allclose(moved.to_pyvista().points, expected.to_pyvista().points,
+                                   atol=1e-5)
+        
+        with self.assertRaises(ValueError):
+            self.doc.transform_all(np.diag([2, 2, 2]), (0, 0, 0))
+        with self.assertRaises(ValueError):
+            Document().transform_all(np.diag([2, 2, 2]), (0, 0, 0))
+    
+    def test_bounded_history(self):
+        """Test that max_history drops the oldest undoable actions."""
+        doc = CADSystem({"max_history": 2}).new_document("Bounded")
+        for i in range(10):
+            doc.add_part(Part(f"Box{i}", Box(1, 1, 1)))
+        
+        self.assertEqual(doc.undo(5), 2)
+        self.assertEqual([part.name for part in doc.parts], [f"Box{i}" for i in range(8)])
+        self.assertEqual(doc.redo(5), 2)
+        self.assertEqual(doc.get_part("Box9"), doc.parts[-1])
+        # Parts whose actions were dropped free their registry slots
+        self.assertLessEqual(len(doc._registry), 3)
+    
+    def test_get_mesh_data(self):
+        """Test that each point set is fanned from its own first vertex."""
+        square = [np.array([0, 0, 0]), np.array([1, 0, 0]), np.array([1, 1, 0]), np.array([0, 1, 0])]
+        self.doc.add_geometry(Points(square))
+        self.doc.add_geometry(Points([p + [0, 0, 1] for p in square]))
+        
+        vertices, faces = self.doc.get_mesh_data()
+        self.assertEqual(vertices.shape, (8, 3))
+        np.testing.assert_array_equal(faces, [[0, 1, 2], [0, 2, 3], [4, 5, 6], [4, 6, 7]])
+    
+    def test_mesh_data_is_read_only(self):
+        """Test that callers cannot desynchronize the document mesh data."""
+        square = [np.array([0, 0, 0]), np.array([1, 0, 0]), np.array([1, 1, 0]), np.array([0, 1, 0])]
+        self.doc.add_geometry(Points(square))
+        vertices, faces = self.doc.get_mesh_data()
+        
+        with self.assertRaises(ValueError):
+            vertices[0] = 5
+        with self.assertRaises(ValueError):
+            faces += 1
+        with self.assertRaises(AttributeError):
+            self.doc.geometry.append(Points(square))
+        
+        self.doc.add_geometry(Points(square))
+        vertices, faces = self.doc.get_mesh_data()
+        self.assertEqual(len(self.doc.geometry), 2)
+        np.testing.assert_array_equal(vertices[:4], np.asarray(square, dtype=np.float32))
+        np.testing.assert_array_equal(faces[2:], [[4, 5, 6], [4, 6, 7]])
 
 class TestIO(unittest.TestCase):
     def setUp(self):
         self.cs = CADSystem()
         self.doc = self.cs.new_document("TestDesign")
 
-    @unittest.skip("STEP export not fully implemented. Fails with mesh to OpenCASCADE conversion error.")
-    def test_export_formats(self):
-        """Test document export functionality."""
+    def _read_stl(self, data):
+        """Decode binary STL bytes into normals and (T, 3, 3) vertices."""
+        count = int.from_bytes(data[80:84], "little")
+        self.assertEqual(len(data), 84 + 50 * count)
+        records = np.frombuffer(data, offset=84, dtype=[
+            ('normal', '<f4', (3,)), ('vertices', '<f4', (3, 3)), ('attr', '<u2')])
+        return records['normal'], records['vertices']
+    
+    def test_export_stl(self):
+        """Test binary STL export of document parts."""
+        self.doc.add_part(Part("TestPart", Box(15, 25, 35)))
+        normals, vertices = self._read_stl(export_document(self.doc, "STL"))
+        
+        self.assertEqual(len(vertices), 12)
+        np.testing.assert_allclose(vertices.min(axis=(0, 1)), [-7.5, -12.5, -17.5])
+        np.testing.assert_allclose(vertices.max(axis=(0, 1)), [7.5, 12.5, 17.5])
+        np.testing.assert_allclose(np.linalg.norm(normals, axis=1), 1, rtol=1e-6)
+        # Normals of a box centered at the origin point away from its center
+        self.assertTrue(np.all(np.einsum('ij,ij->i', normals, vertices.mean(axis=1)) > 0))
+        
+        self.assertEqual(export_document(Document(), "stl"), bytes(84))
+        
+        with self.assertRaises(ValueError):
+            export_document(self.doc, "INVALID_FORMAT")
+    
+    def test_export_stl_file(self):
+        """Test writing the document point sets to an STL file."""
+        square = [np.array([0, 0, 0]), np.array([1, 0, 0]), np.array([1, 1, 0]), np.array([0, 1, 0])]
+        self.doc.add_geometry(Points(square))
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "points.stl")
+            self.assertTrue(export_stl(self.doc, path))
+            with open(path, "rb") as f:
+                normals, vertices = self._read_stl(f.read())
+        
+        vertices_in, faces = self.doc.get_mesh_data()
+        np.testing.assert_array_equal(vertices, vertices_in[faces])
+        np.testing.assert_array_equal(normals, [[0, 0, 1], [0, 0, 1]])
+
+    @unittest.skipUnless(importlib.util.find_spec("numba"), "requires numba")
+    def test_stl_records_kernel(self):
+        """Test that the Numba STL kernel matches the NumPy path byte for byte."""
+        from cad_system.document.io import _STL_RECORD, _fill_stl_records, _stl_records
+        
+        points, triangles = Cylinder(5, 15).rotate(30, (1, 1, 0))._arrays()
+        # Include a degenerate triangle, whose normal stays zero
+        triangles = np.vstack([triangles, [[0, 0, 1]]])
+        
+        records = np.zeros(len(triangles), dtype=_STL_RECORD)
+        _fill_stl_records(points, triangles, records)
+        self.assertEqual(records.tobytes(), _stl_records(points, triangles).tobytes())
+
+    @unittest.skipUnless(importlib.util.find_spec("OCC"), "STEP export requires pythonocc-core")
+    def test_export_step(self):
+        """Test STEP export of document parts."""
         part = Part("TestPart", Box(15, 25, 35))
         self.doc.add_part(part)
         
-        # Test STL export
-        stl_data = export_document(self.doc, "STL")
-        self.assertTrue(len(stl_data) > 0)
-
-        # Test STEP export
         step_data = export_document(self.doc, "STEP")
         self.assertTrue(len(step_data) > 0)
         
@@ -161,19 +479,28 @@ class TestIO(unittest.TestCase):
         self.assertTrue("HEADER" in step_str)
         self.assertTrue("DATA" in step_str)
         self.assertTrue("END-ISO-10303-21" in step_str)
-
-        # Test unsupported format
-        with self.assertRaises(ValueError):
-            export_document(self.doc, "INVALID_FORMAT")
+    
+    @unittest.skipUnless(importlib.util.find_spec("OCC"), "STEP export requires pythonocc-core")
+    def test_export_step_shapes(self):
+        """Test both mesh conversions used by the STEP exporter."""
+        from cad_system.document.io import _mesh_to_occ_shape, _mesh_to_occ_triangulation
+        from OCC.Core.BRep import BRep_Tool
+        from OCC.Core.TopLoc import TopLoc_Location
+        
+        mesh = Box(15, 25, 35).to_pyvista()
+        triangulation = BRep_Tool.Triangulation(_mesh_to_occ_triangulation(mesh), TopLoc_Location())
+        self.assertEqual(triangulation.NbNodes(), mesh.n_points)
+        self.assertEqual(triangulation.NbTriangles(), mesh.n_cells)
+        self.assertFalse(_mesh_to_occ_shape(mesh).IsNull())
 
 class TestVisualization(unittest.TestCase):
     def setUp(self):
         self.cs = CADSystem()
         self.doc = self.cs.new_document("TestDesign")
             
-    @patch('pyvista.Plotter')
-    def test_visualization(self, MockPlotter):
+    def test_visualization(self):
         """Test document visualization functionality."""
+        MockPlotter = MagicMock()
         # Arrange
         box = Part("Box", Box(10, 10, 10))
         cyl = Part("Cylinder", Cylinder(5, 15))
@@ -185,7 +512,7 @@ class TestVisualization(unittest.TestCase):
         
         # Act & Assert
         try:
-            visualize_document(self.doc)
+            visualize_document(self.doc, plotter_cls=MockPlotter)
             
             # Verify plotter was created and used correctly
             MockPlotter.assert_called_once()
@@ -195,6 +522,24 @@ class TestVisualization(unittest.TestCase):
         except Exception as e:
             self.fail(f"Visualization raised an exception: {str(e)}")
 
+    def test_visualization_shared_geometry(self):
+        """Test that parts sharing a geometry are meshed once."""
+        box = Part("Box", Box(10, 10, 10))
+        self.doc.add_part(box)
+        self.doc.add_part(Part("Copy", box.geometry))
+        self.doc.add_part(Part("Cylinder", Cylinder(5, 15)))
+        MockPlotter = MagicMock()
+        
+        with patch("os.cpu_count", return_value=4), \
+             patch.object(Box, "_create_mesh", autospec=True,
+                          side_effect=Box._create_mesh) as create_mesh:
+            visualize_document(self.doc, plotter_cls=MockPlotter)
+        
+        create_mesh.assert_called_once()
+        add_mesh = MockPlotter.return_value.add_mesh
+        self.assertEqual(add_mesh.call_count, 3)
+        self.assertIs(add_mesh.call_args_list[0].args[0], add_mesh.call_args_list[1].args[0])
+
 # CADSystem Tests
 class TestCADSystem(unittest.TestCase):
     def setUp(self):
@@ -202,31 +547,32 @@ class TestCADSystem(unittest.TestCase):
 
     def test_load_document_success(self):
         """Test loading a document from a valid JSON file."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json") as tmp_file:
-            json.dump({"name": "TestDocName", "parts": []}, tmp_file)
-            tmp_file_path = tmp_file.name
-        
-        doc = self.cs.load_document(tmp_file_path)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_file_path = os.path.join(tmp_dir, "doc.json")
+            with open(tmp_file_path, "w") as tmp_file:
+                json.dump({"name": "TestDocName", "parts": []}, tmp_file)
+            
+            doc = self.cs.load_document(tmp_file_path)
         self.assertIsInstance(doc, Document)
         self.assertEqual(doc.name, "TestDocName")
-        
-        os.remove(tmp_file_path)
 
     def test_load_document_file_not_found(self):
         """Test loading a document from a non-existent file."""
         with self.assertRaises(FileNotFoundError):
             self.cs.load_document("non_existent_document.json")
 
-    def test_load_document_invalid_json(self):
-        """Test loading a document from an invalid JSON file."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json") as tmp_file:
-            tmp_file.write('{"name": "TestDocName",')  # Invalid JSON
-            tmp_file_path = tmp_file.name
+    def test_load_document_from_file_object(self):
+        """Test loading a document from binary and text file objects."""
+        doc = self.cs.load_document(io.BytesIO(b'{"name": "TestDocName", "parts": []}'))
+        self.assertEqual(doc.name, "TestDocName")
         
+        doc = self.cs.load_document(io.StringIO('{"name": "TestDocName", "parts": []}'))
+        self.assertEqual(doc.name, "TestDocName")
+
+    def test_load_document_invalid_json(self):
+        """Test loading a document from invalid JSON."""
         with self.assertRaises(json.JSONDecodeError):
-            self.cs.load_document(tmp_file_path)
-            
-        os.remove(tmp_file_path)
+            self.cs.load_document(io.BytesIO(b'{"name": "TestDocName",'))  # Invalid JSON
 
 if __name__ == "__main__":
     unittest.main()